@@ -1,18 +1,40 @@
+import importlib
+from collections.abc import Collection
+
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
-from app.api.v1.endpoints import (
-    auth,
-    contact_requests,
-    contacts,
-    roles,
-    users,
-)
+from app.core.fastapi_patches import apply_fastapi_patches
 
-api_router = APIRouter()
-api_router.include_router(roles.router, prefix="/roles", tags=["roles"])
-api_router.include_router(contacts.router, prefix="/contacts", tags=["contacts"])
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
-api_router.include_router(
-    contact_requests.router, prefix="/contact-requests", tags=["contact_requests"]
+apply_fastapi_patches()
+
+# (submódulo de endpoints, prefijo, tag): una sola tabla de registro de routers
+_ROUTERS = (
+    ("roles", "/roles", "roles"),
+    ("contacts", "/contacts", "contacts"),
+    ("auth", "/auth", "auth"),
+    ("users", "/users", "users"),
+    ("contact_requests", "/contact-requests", "contact_requests"),
 )
+
+
+def mount_routes(api_router: APIRouter, disabled: Collection[str] = ()) -> None:
+    """Importa cada módulo de endpoints al montarlo y registra su router.
+
+    Los módulos se importan aquí y no al cargar este archivo. Para los routers
+    deshabilitados (``disabled``) solo se omite el propio módulo de endpoints y
+    el registro de sus rutas: los repositorios, servicios y modelos ORM se
+    cargan igualmente a través de ``app.core.deps``.
+    """
+    for name, prefix, tag in _ROUTERS:
+        if name in disabled:
+            continue
+        module = importlib.import_module(f"app.api.v1.endpoints.{name}")
+        api_router.include_router(module.router, prefix=prefix, tags=[tag])
+
+
+def create_api_router(disabled: Collection[str] = ()) -> APIRouter:
+    """Crea el router de la API v1 con todos los routers habilitados."""
+    api_router = APIRouter(default_response_class=ORJSONResponse)
+    mount_routes(api_router, disabled)
+    return api_router
@@ -4,12 +4,17 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 
-from app.core.deps import get_contact_request_service
+from app.core.deps import (
+    UnitOfWork,
+    get_contact_request_service,
+    get_unit_of_work,
+)
 from app.schemas.contact_request import ContactRequestCreate, ContactRequestResponse
 from app.services.contact_request_service import ContactRequestService
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -20,11 +25,10 @@ router = APIRouter()
 async def create_contact_request(
     payload: ContactRequestCreate,
     service: Annotated[ContactRequestService, Depends(get_contact_request_service)],  # noqa: B008
+    uow: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> ContactRequestResponse:
     obj = await service.create_request(payload)
-    return ContactRequestResponse(
-        id=str(obj.id),
-        full_name=obj.full_name,
-        email=obj.email,
-        message=obj.message,
-    )
+    # Sin efecto con el backend en memoria: la sesión no llegó a conectarse
+    await uow.commit()
+    # from_attributes: se valida directamente desde la entidad de dominio
+    return ContactRequestResponse.model_validate(obj)
@@ -1,22 +1,43 @@
+from collections.abc import AsyncIterator
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
 
-from app.core.deps import get_contact_service
+from app.core.deps import UnitOfWork, get_contact_service, get_unit_of_work
+from app.domain.models.contact import Contact
 from app.schemas.contact import ContactCreate, ContactResponse
+from app.schemas.error import ErrorResponse
 from app.services.contact_service import ContactService
 
-router = APIRouter()
+router = APIRouter(
+    default_response_class=ORJSONResponse,
+    responses={404: {"model": ErrorResponse}},
+)
+
+# Serializa la lista completa en una sola pasada de pydantic-core
+_CONTACT_LIST_ADAPTER = TypeAdapter(list[ContactResponse])
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     contact: ContactCreate,
-    service: ContactService = Depends(get_contact_service),  # noqa: B008
+    service: Annotated[ContactService, Depends(get_contact_service)],  # noqa: B008
+    uow: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> ContactResponse:
-    return await service.create_contact(contact)
+    created = await service.create_contact(contact)
+    await uow.commit()
+    return created
 
-@router.get("/", response_model=list[ContactResponse])
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": list[ContactResponse]}},
+)
 async def list_contacts(
+    service: Annotated[ContactService, Depends(get_contact_service)],  # noqa: B008
     email: str | None = Query(
         None,
         description="Filtrar contactos por email exacto",
@@ -27,27 +48,59 @@ async def list_contacts(
         description="Filtrar por estado leído (True o False)",
         examples=[True]
     ),
-    service: ContactService = Depends(get_contact_service),  # noqa: B008
-) -> list[ContactResponse]:
-    return await service.get_contacts(email=email, is_read=is_read)
+) -> Response:
+    contacts = await service.get_contacts(email=email, is_read=is_read)
+    return Response(
+        content=_CONTACT_LIST_ADAPTER.dump_json(contacts), media_type="application/json"
+    )
+
+async def _contacts_ndjson(contacts: AsyncIterator[Contact]) -> AsyncIterator[bytes]:
+    """Serializa cada contacto como una línea JSON (orjson maneja UUID y datetime)."""
+    async for c in contacts:
+        yield orjson.dumps(
+            {
+                "id": c.id,
+                "full_name": c.full_name,
+                "email": c.email,
+                "message": c.message,
+                "is_read": c.is_read,
+                "created_at": c.created_at,
+                "updated_at": c.updated_at,
+            },
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_contacts(
+    service: Annotated[ContactService, Depends(get_contact_service)],  # noqa: B008
+) -> StreamingResponse:
+    """Exporta todos los contactos como NDJSON sin cargarlos en memoria.
+
+    La sesión de ``get_db`` sigue abierta mientras se envía la respuesta, así
+    que las filas se leen del cursor por lotes a medida que se escriben.
+    """
+    return StreamingResponse(
+        _contacts_ndjson(service.iter_contacts()), media_type="application/x-ndjson"
+    )
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: UUID,
-    service: ContactService = Depends(get_contact_service),  # noqa: B008
+    service: Annotated[ContactService, Depends(get_contact_service)],  # noqa: B008
 ) -> ContactResponse:
-    try:
-        contact = await service.get_contact(contact_id)
-        # Convertir el modelo de dominio a esquema de respuesta
-        return ContactResponse(
-            id=contact.id,
-            email=contact.email,
-            message=contact.message,
-            full_name=contact.full_name,
-            is_read=contact.is_read
-        )
-    except Exception as err:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(err),
-        ) from err
+    # EntityNotFoundError se traduce a 404 en el manejador de excepciones
+    contact = await service.get_contact(contact_id)
+    # Convertir el modelo de dominio a esquema de respuesta
+    return ContactResponse(
+        id=contact.id,
+        email=contact.email,
+        message=contact.message,
+        full_name=contact.full_name,
+        is_read=contact.is_read,
+        created_at=contact.created_at,
+        updated_at=contact.updated_at,
+    )
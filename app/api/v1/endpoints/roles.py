@@ -1,20 +1,37 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
 
-from app.core.deps import get_role_service
+from app.core.cache import TTLCache
+from app.crud.base import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.deps import UnitOfWork, get_role_service, get_unit_of_work
+from app.schemas.error import ErrorResponse
 from app.schemas.role import RoleCreate, RoleResponse
 from app.services.role_service import RoleService
 
-router = APIRouter()
+router = APIRouter(
+    default_response_class=ORJSONResponse,
+    responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+)
+
+# Serializa la lista completa en una sola pasada de pydantic-core
+_ROLE_LIST_ADAPTER = TypeAdapter(list[RoleResponse])
+
+# El catálogo de roles cambia poco: listados ya serializados por filtro
+_ROLE_LIST_CACHE: TTLCache[bytes] = TTLCache(ttl=60.0, maxsize=128)
 
 @router.post("/", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
 async def create_role(
     role: RoleCreate,
     service: Annotated[RoleService, Depends(get_role_service)],  # noqa: B008
+    uow: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> RoleResponse:
     role_domain = await service.create_role(role)
+    await uow.commit()
+    _ROLE_LIST_CACHE.clear()
     # Convertir el modelo de dominio a esquema de respuesta
     return RoleResponse(
         id=role_domain.id,
@@ -23,7 +40,11 @@ async def create_role(
     )
 
 
-@router.get("/", response_model=list[RoleResponse])
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": list[RoleResponse]}},
+)
 async def list_roles(
     service: Annotated[RoleService, Depends(get_role_service)],  # noqa: B008
     name: str | None = Query(
@@ -31,32 +52,35 @@ async def list_roles(
         description="Filtrar roles por nombre exacto",
         examples=["admin"]
     ),
-) -> list[RoleResponse]:
-    roles = await service.list_roles(name=name)
-    # Convertir los modelos de dominio a esquemas de respuesta
-    return [
-        RoleResponse(
-            id=role.id,
-            name=role.name,
-            description=role.description
-        ) for role in roles
-    ]
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Tamaño máximo de la página",
+    ),
+    after_id: UUID | None = Query(
+        None, description="Cursor: id del último elemento de la página anterior"
+    ),
+) -> Response:
+    cache_key = (name, limit, after_id)
+    body = _ROLE_LIST_CACHE.get(cache_key)
+    if body is None:
+        # El servicio ya devuelve esquemas de respuesta construidos
+        roles = await service.list_roles(name=name, limit=limit, after_id=after_id)
+        body = _ROLE_LIST_ADAPTER.dump_json(roles)
+        _ROLE_LIST_CACHE.set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 @router.get("/{role_id}", response_model=RoleResponse)
 async def get_role(
     role_id: UUID,
-    role_service: RoleService = Depends(get_role_service),  # noqa: B008
+    role_service: Annotated[RoleService, Depends(get_role_service)],  # noqa: B008
 ) -> RoleResponse:
-    try:
-        role = await role_service.get_role(role_id)
-        # Convertir el modelo de dominio a esquema de respuesta
-        return RoleResponse(
-            id=role.id,
-            name=role.name,
-            description=role.description
-        )
-    except Exception as err:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(err),
-        ) from err
+    # EntityNotFoundError se traduce a 404 en el manejador de excepciones
+    role = await role_service.get_role(role_id)
+    # Convertir el modelo de dominio a esquema de respuesta
+    return RoleResponse(
+        id=role.id,
+        name=role.name,
+        description=role.description
+    )
@@ -1,37 +1,73 @@
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
 
-from app.core.deps import get_user_service, get_current_user
+from app.core.cache import TTLCache
+from app.crud.base import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.deps import (
+    UnitOfWork,
+    get_current_user,
+    get_unit_of_work,
+    get_user_service,
+)
+from app.schemas.error import ErrorResponse
 from app.schemas.user import UserCreate, UserResponse
 from app.services.user_service import UserService
 from app.domain.models.user import User as UserDomain
 
-router = APIRouter()
+router = APIRouter(
+    default_response_class=ORJSONResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+    },
+)
+
+# Serializa la lista completa en una sola pasada de pydantic-core
+_USER_LIST_ADAPTER = TypeAdapter(list[UserResponse])
+
+# Listados ya serializados por filtro (email, is_active)
+_USER_LIST_CACHE: TTLCache[bytes] = TTLCache(ttl=30.0, maxsize=128)
+
+
+def _user_to_dict(user: UserDomain) -> dict[str, Any]:
+    """Serializa un usuario de dominio sin pasar por la validación de UserResponse.
+
+    ORJSONResponse codifica UUID y datetime de forma nativa.
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "full_name": getattr(user, "full_name", None),
+        "is_active": getattr(user, "is_active", True),
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
+
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_in: UserCreate,
     user_service: Annotated[UserService, Depends(get_user_service)],  # noqa: B008
+    uow: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> UserResponse:
-    try:
-        user = await user_service.create_user_with_hashed_password(user_in)
-        # Convertir el modelo de dominio a esquema de respuesta
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            full_name=user.full_name if hasattr(user, 'full_name') else None,
-            is_active=user.is_active if hasattr(user, 'is_active') else True
-        )
-    except Exception as err:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(err),
-        ) from err
+    # Un email duplicado (ValidationError) se traduce a 400 en el manejador
+    # de excepciones; el servicio ya devuelve el esquema de respuesta
+    user = await user_service.create_user_with_hashed_password(user_in)
+    await uow.commit()
+    _USER_LIST_CACHE.clear()
+    return user
 
 
-@router.get("/", response_model=list[UserResponse])
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": list[UserResponse]}},
+)
 async def list_users(
     user_service: Annotated[UserService, Depends(get_user_service)],  # noqa: B008
     email: str | None = Query(
@@ -44,40 +80,72 @@ async def list_users(
         description="Filtrar por estado activo (True o False)",
         examples=[True]
     ),
-) -> list[UserResponse]:
-    users = await user_service.get_users(email=email, is_active=is_active)
-    return [UserResponse(id=u.id, email=u.email, full_name=u.full_name) for u in users]
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Tamaño máximo de la página",
+    ),
+    after_id: UUID | None = Query(
+        None, description="Cursor: id del último elemento de la página anterior"
+    ),
+) -> Response:
+    cache_key = (email, is_active, limit, after_id)
+    body = _USER_LIST_CACHE.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    users = await user_service.get_users(
+        email=email, is_active=is_active, limit=limit, after_id=after_id
+    )
+    # Los datos vienen de la capa de dominio: se construye sin revalidar
+    items = [
+        UserResponse.model_construct(
+            id=u.id,
+            email=u.email,
+            full_name=u.full_name,
+            is_active=u.is_active,
+            created_at=u.created_at,
+            updated_at=u.updated_at,
+        )
+        for u in users
+    ]
+    body = _USER_LIST_ADAPTER.dump_json(items)
+    _USER_LIST_CACHE.set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
-@router.get("/{user_id}", response_model=UserResponse)
+@router.get(
+    "/me",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserResponse}},
+)
+async def read_current_user(
+    current_user: Annotated[UserDomain, Depends(get_current_user)],  # noqa: B008
+) -> dict[str, Any]:
+    """Devuelve los datos del usuario autenticado."""
+    return _user_to_dict(current_user)
+
+@router.get(
+    "/{user_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserResponse}},
+)
 async def get_user(
     user_id: UUID,
     user_service: Annotated[UserService, Depends(get_user_service)],  # noqa: B008
-) -> UserResponse:
+) -> dict[str, Any]:
     user = await user_service.get_user(user_id)
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name if hasattr(user, 'full_name') else None,
-        is_active=user.is_active if hasattr(user, 'is_active') else True
-    )
+    return _user_to_dict(user)
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: UUID,
     user_service: Annotated[UserService, Depends(get_user_service)],  # noqa: B008
+    uow: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> None:
     await user_service.delete_user(user_id)
+    await uow.commit()
+    _USER_LIST_CACHE.clear()
     return None
-
-
-@router.get("/me", response_model=UserResponse)
-async def read_current_user(
-    current_user: Annotated[UserDomain, Depends(get_current_user)],  # noqa: B008
-) -> UserResponse:
-    """Devuelve los datos del usuario autenticado."""
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        full_name=getattr(current_user, "full_name", None),
-        is_active=getattr(current_user, "is_active", True),
-    )
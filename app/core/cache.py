@@ -0,0 +1,47 @@
+"""Caché en memoria con expiración para respuestas de solo lectura.
+
+Pensada para catálogos que cambian poco (roles, usuarios): cada worker mantiene
+su propia copia, por lo que el TTL acota cuánto tiempo puede servirse un dato
+desactualizado cuando otro worker lo modifica.
+"""
+import time
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Diccionario acotado cuyas entradas caducan tras ``ttl`` segundos."""
+
+    def __init__(self, ttl: float, maxsize: int = 128) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[V, float]] = {}
+
+    def get(self, key: Hashable) -> V | None:
+        """Devuelve el valor si existe y no ha caducado."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry[0]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Guarda un valor; si se alcanza ``maxsize`` se vacía la caché."""
+        if len(self._data) >= self.maxsize and key not in self._data:
+            self._data.clear()
+        self._data[key] = (value, time.monotonic() + self.ttl)
+
+    def pop(self, key: Hashable) -> None:
+        """Invalida una entrada concreta si existe."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Invalida todas las entradas."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,17 +1,15 @@
 from collections.abc import AsyncGenerator
-from datetime import datetime, timedelta, timezone
-from typing import Annotated, Any, AsyncGenerator, Optional
+from functools import cache
+from typing import Annotated, Any
 from uuid import UUID
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.security import oauth2_scheme
-from app.core.security.jwt import decode_access_token
+from app.core.security.hashing import PasswordHasher, default_password_hasher
+from app.core.security.jwt import decode_access_token_cached
 from app.crud.contact import ContactRepository as ContactRepositoryImpl
-from app.crud.contact_request import (
-    InMemoryContactRequestRepository,
-    SQLAlchemyContactRequestRepository,
-)
 from app.crud.role import RoleRepositoryImpl
 from app.crud.user import UserRepository as UserRepositoryImpl
 from app.database.session import AsyncSessionLocal
@@ -21,6 +19,7 @@ from app.domain.repositories.base import (
     IRoleRepository,
     IUserRepository,
 )
+from app.domain.email_protocol import EmailSender
 from app.domain.repositories.contact_request import IContactRequestRepository
 from app.services.auth_service import AuthService
 from app.services.contact_service import ContactService
@@ -31,93 +30,180 @@ from app.services.user_service import UserService
 
 # Obtener sesión de base de datos asíncrona
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    # Solo abre y cierra la sesión: lo no confirmado se descarta al cerrar. El
+    # commit no puede ir aquí porque FastAPI 0.105 ejecuta el cierre de las
+    # dependencias ``yield`` después de enviar la respuesta.
     async with AsyncSessionLocal() as session:
         yield session
 
 
+class UnitOfWork:
+    """Confirma de forma explícita la transacción de la sesión del request.
+
+    Los endpoints de escritura esperan ``commit()`` antes de responder, así un
+    fallo al confirmar llega al cliente como error y no como un 2xx. Los
+    repositorios solo hacen flush.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def commit(self) -> None:
+        await self._session.commit()
+
+
+async def get_unit_of_work(
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> UnitOfWork:
+    # ``get_db`` se resuelve una vez por request: es la misma sesión que usan
+    # los repositorios del endpoint
+    return UnitOfWork(db)
+
+
 # Repositorios
 async def get_user_repository(
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AsyncGenerator[IUserRepository, None]:
-    yield UserRepositoryImpl(db=db)
+) -> IUserRepository:
+    return UserRepositoryImpl(db=db)
 
 
 async def get_role_repository(
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AsyncGenerator[IRoleRepository, None]:
-    yield RoleRepositoryImpl(db=db)
+) -> IRoleRepository:
+    return RoleRepositoryImpl(db=db)
 
 
 async def get_contact_repository(
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AsyncGenerator[IContactRepository, None]:
-    yield ContactRepositoryImpl(db=db)
+) -> IContactRepository:
+    return ContactRepositoryImpl(db=db)
+
+
+# Singletons de proceso (async para que FastAPI no los despache al threadpool)
+
+async def get_hasher() -> PasswordHasher:
+    """Devuelve el hasher Argon2 compartido por todo el proceso."""
+    return default_password_hasher
+
+
+@cache
+def _email_sender() -> EmailSender:
+    # Import perezoso: la infraestructura SMTP solo se carga si se usa
+    from app.infrastructure.email.smtp_email import SMTPEmailSender
+
+    return SMTPEmailSender()
+
+
+async def get_email_sender() -> EmailSender:
+    """Devuelve el remitente SMTP, creado una sola vez por proceso."""
+    return _email_sender()
 
 
 # Servicios
 
 async def get_user_service(
     user_repo: Annotated[IUserRepository, Depends(get_user_repository)],
-) -> AsyncGenerator[UserService, None]:
-    yield UserService(user_repository=user_repo)
+    hasher: Annotated[PasswordHasher, Depends(get_hasher)],
+) -> UserService:
+    return UserService(user_repository=user_repo, hasher=hasher)
 
 
 async def get_role_service(
     role_repo: Annotated[IRoleRepository, Depends(get_role_repository)],
-) -> AsyncGenerator[RoleService, None]:
-    yield RoleService(role_repository=role_repo)
+) -> RoleService:
+    return RoleService(role_repository=role_repo)
 
 
 async def get_contact_service(
     contact_repo: Annotated[IContactRepository, Depends(get_contact_repository)],
-) -> AsyncGenerator[ContactService, None]:
-    yield ContactService(contact_repository=contact_repo)
+) -> ContactService:
+    return ContactService(contact_repository=contact_repo)
 
 
 async def get_auth_service(
     user_repo: Annotated[IUserRepository, Depends(get_user_repository)],
-) -> AsyncGenerator[AuthService, None]:
-    yield AuthService(user_repository=user_repo)
+) -> AuthService:
+    return AuthService(user_repository=user_repo)
 
 
 # ----------------------- Seguridad y autenticación -----------------------
 
-async def get_current_user(
+# Respuestas 401 prearmadas; se relanzan con ``with_traceback(None)`` para que
+# el traceback no crezca con cada reutilización de la misma instancia
+_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_USER_NOT_FOUND_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Usuario no encontrado",
+)
+
+
+async def get_token_payload(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
+) -> dict[str, Any]:
+    """Valida el JWT antes de resolver dependencias con acceso a la base de datos.
+
+    Al ser una dependencia propia, un token inválido corta la resolución antes de
+    abrir la sesión que necesita ``get_user_repository``. Los payloads válidos
+    se reutilizan mientras el token siga vigente.
+    """
+    # AuthMiddleware (si está activo) ya decodificó este mismo token
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is None:
+        payload = decode_access_token_cached(token)
+    if payload is None:
+        raise _CREDENTIALS_EXC.with_traceback(None)
+    return payload
+
+
+async def get_current_user(
+    payload: Annotated[dict[str, Any], Depends(get_token_payload)],
     user_repo: Annotated[IUserRepository, Depends(get_user_repository)],
 ) -> User:
-    """Devuelve el usuario autenticado a partir del JWT o lanza 401."""
-    payload = decode_access_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token inválido o expirado",
-        )
-    user_id = payload.get("sub")
+    """Devuelve el usuario autenticado a partir del JWT o lanza 401.
+
+    El payload ya llega verificado (y cacheado) por ``get_token_payload``. El
+    usuario se lee en cada request: un usuario eliminado o desactivado deja de
+    autenticarse de inmediato en todos los workers.
+    """
+    # El repositorio cachea por ``UUID``: con el ``str`` del JWT nunca acertaría
+    try:
+        user_id = UUID(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        raise _CREDENTIALS_EXC.with_traceback(None) from None
     user = await user_repo.get(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Usuario no encontrado",
-        )
+        raise _USER_NOT_FOUND_EXC.with_traceback(None)
     return user
 
 # ------------------- ContactRequest dependencies -------------------
-async def get_contact_request_repository(
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> AsyncGenerator[IContactRequestRepository, None]:
-    # Para usar con base de datos real
-    if True:  # Establecer en True para usar PostgreSQL
-        yield SQLAlchemyContactRequestRepository(db=db)
-    else:
-        # Fallback a la versión en memoria para pruebas
-        yield InMemoryContactRequestRepository()
+# El backend se elige una sola vez al importar, no en cada request
+if settings.USE_SQL_CONTACT_REQUESTS:
+    from app.crud.contact_request import SQLAlchemyContactRequestRepository
+
+    async def get_contact_request_repository(
+        db: Annotated[AsyncSession, Depends(get_db)],
+    ) -> IContactRequestRepository:
+        return SQLAlchemyContactRequestRepository(db=db)
+
+else:
+    from app.crud.contact_request import InMemoryContactRequestRepository
+
+    # Instancia única: en memoria los datos deben sobrevivir entre requests
+    _in_memory_contact_requests = InMemoryContactRequestRepository()
+
+    async def get_contact_request_repository() -> IContactRequestRepository:
+        return _in_memory_contact_requests
 
 
 async def get_contact_request_service(
     repo: Annotated[IContactRequestRepository, Depends(get_contact_request_repository)],  # noqa: B008
-) -> AsyncGenerator[ContactRequestService, None]:
-    from app.infrastructure.email.smtp_email import SMTPEmailSender
-
-    email_sender = SMTPEmailSender()
-    yield ContactRequestService(repository=repo, email_sender=email_sender)
+    email_sender: Annotated[EmailSender, Depends(get_email_sender)],
+) -> ContactRequestService:
+    return ContactRequestService(repository=repo, email_sender=email_sender)
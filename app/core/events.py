@@ -3,15 +3,22 @@ Manejadores de eventos para la aplicación FastAPI.
 Estos eventos se ejecutan durante la inicialización (startup) y finalización (shutdown)
 de la aplicación, permitiendo realizar tareas como establecer/cerrar conexiones a la DB.
 """
+import asyncio
 import logging
 
+from anyio import to_thread
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.security.hashing import hash_benchmark
+from app.core.security.jwt import hmac_uses_openssl
 from app.database.session import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
+# Hilos disponibles para dependencias/endpoints síncronos (anyio usa 40 por defecto)
+THREADPOOL_TOKENS = 100
+
 
 async def startup_event() -> None:
     """
@@ -20,6 +27,22 @@ async def startup_event() -> None:
     """
     logger.info("🚀 Aplicación iniciando...")
 
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
+
+    # uvloop reduce el overhead del event loop; avisar si no está activo
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if not loop_module.startswith("uvloop"):
+        logger.warning(
+            "Event loop %s en uso: se recomienda ejecutar uvicorn con --loop uvloop",
+            loop_module,
+        )
+
+    # HS256 se verifica en cada request autenticada: debe usar OpenSSL
+    if not hmac_uses_openssl():
+        logger.warning(
+            "hashlib no usa OpenSSL: la verificación HS256 de los JWT será más lenta"
+        )
+
     try:
         async with AsyncSessionLocal() as db:
             await db.execute(text("SELECT 1"))
@@ -28,6 +51,9 @@ async def startup_event() -> None:
         logger.error("❌ Error al conectar a la base de datos", exc_info=True)
         raise
 
+    # Medir el coste del verify Argon2 en este host (warning si es excesivo)
+    hash_benchmark()
+
     # TODO: Inicializar servicios externos (Redis, S3, etc.)
     # TODO: Verificar licencias, planificaciones o variables críticas
 
@@ -50,6 +76,6 @@ async def shutdown_event() -> None:
             await db.execute(text("SELECT 1"))
         logger.info("Conexión a la base de datos verificada correctamente")
     except Exception as e:
-        logger.error(f"Error al conectar a la base de datos: {e}")
+        logger.error("Error al conectar a la base de datos: %s", e, exc_info=True)
         # No lanzamos la excepción durante el cierre para permitir un apagado limpio
     logger.info("Aplicación cerrando... Liberando recursos.")
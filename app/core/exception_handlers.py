@@ -1,39 +1,92 @@
 """Manejadores de excepciones personalizados para la aplicación."""
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response
 from typing import Any, Dict
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+from app.domain.exceptions.base import (
+    BusinessRuleViolationError,
+    DomainError,
+    EntityNotFoundError,
+    UnauthorizedOperationError,
+    ValidationError,
+)
+
+# Código HTTP por tipo de excepción de dominio (se resuelve siguiendo el MRO)
+DOMAIN_EXCEPTION_STATUS: dict[type[DomainError], int] = {
+    EntityNotFoundError: status.HTTP_404_NOT_FOUND,
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+    BusinessRuleViolationError: status.HTTP_409_CONFLICT,
+    UnauthorizedOperationError: status.HTTP_403_FORBIDDEN,
+}
+
+# Componentes de ``loc`` que identifican un error de autenticación
+AUTH_LOC_KEYS = frozenset({"authorization", "token"})
+
+# Cuerpo y cabeceras precalculados; la ``Response`` se crea en cada llamada
+# porque los middlewares que la envuelven (p. ej. RequestLoggingMiddleware)
+# añaden cabeceras sobre la misma lista que enviaría una instancia compartida
+_CREDENTIALS_BODY = b'{"detail":"Could not validate credentials"}'
+_CREDENTIALS_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _credentials_response() -> Response:
+    """Respuesta 401 nueva con el cuerpo y las cabeceras precalculados."""
+    return Response(
+        content=_CREDENTIALS_BODY,
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        headers=_CREDENTIALS_HEADERS,
+        media_type="application/json",
+    )
+
+
+async def http_exception_handler(
+    request: Request, exc: HTTPException
+) -> ORJSONResponse:
     """Maneja las excepciones HTTP personalizadas."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
         headers=exc.headers,
     )
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(
+    request: Request, exc: RequestValidationError
+) -> Response:
     """Maneja los errores de validación de Pydantic.
     
     Convierte los errores 422 a 401 cuando el error está relacionado con la autenticación.
     """
     # Verificar si el error está relacionado con la autenticación
     for error in exc.errors():
-        if any("authorization" in str(loc).lower() for loc in error["loc"]) or \
-           any("token" in str(loc).lower() for loc in error["loc"]):
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Could not validate credentials"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if not AUTH_LOC_KEYS.isdisjoint(str(loc).lower() for loc in error["loc"]):
+            return _credentials_response()
     
     # Para otros errores de validación, mantener el comportamiento por defecto
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": exc.errors()},
+        # jsonable_encoder: ``ctx`` puede incluir la excepción original del validador
+        content={"detail": jsonable_encoder(exc.errors())},
     )
 
+async def domain_exception_handler(
+    request: Request, exc: DomainError
+) -> ORJSONResponse:
+    """Traduce las excepciones de dominio a respuestas HTTP.
+
+    Centraliza el mapeo para que los endpoints no necesiten envolver cada
+    llamada al servicio en ``try/except``.
+    """
+    status_code = status.HTTP_400_BAD_REQUEST
+    for exc_type in type(exc).__mro__:
+        if exc_type in DOMAIN_EXCEPTION_STATUS:
+            status_code = DOMAIN_EXCEPTION_STATUS[exc_type]
+            break
+    return ORJSONResponse(status_code=status_code, content={"detail": exc.message})
+
 def setup_exception_handlers(app: FastAPI) -> None:
     """Configura los manejadores de excepciones personalizados."""
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(DomainError, domain_exception_handler)
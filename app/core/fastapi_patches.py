@@ -0,0 +1,46 @@
+"""Parches de rendimiento sobre la resolución de dependencias de FastAPI.
+
+``solve_dependencies`` vuelve a introspeccionar cada callable de dependencia en
+cada request (``inspect.iscoroutinefunction`` y similares) aunque el resultado
+nunca cambia. Aquí se memorizan esas comprobaciones por callable usando un
+``WeakKeyDictionary`` para no retener objetos que FastAPI ya haya descartado.
+"""
+from collections.abc import Callable
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from fastapi.dependencies import utils as dependency_utils
+
+_PATCHED_CHECKS = ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable")
+
+_applied = False
+
+
+def _memoize_check(check: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Envuelve una comprobación de introspección con una caché por callable."""
+    cache: WeakKeyDictionary[Any, bool] = WeakKeyDictionary()
+
+    def cached_check(call: Any) -> bool:
+        try:
+            return cache[call]
+        except KeyError:
+            result = cache[call] = check(call)
+            return result
+        except TypeError:
+            # Callables sin soporte de weakref o no hashables: sin caché
+            return check(call)
+
+    cached_check.__wrapped__ = check  # type: ignore[attr-defined]
+    return cached_check
+
+
+def apply_fastapi_patches() -> None:
+    """Aplica los parches una sola vez (idempotente)."""
+    global _applied
+    if _applied:
+        return
+    for name in _PATCHED_CHECKS:
+        original = getattr(dependency_utils, name, None)
+        if original is not None:
+            setattr(dependency_utils, name, _memoize_check(original))
+    _applied = True
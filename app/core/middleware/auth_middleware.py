@@ -1,70 +1,88 @@
 """Middleware personalizado para manejo de autenticación y códigos de estado HTTP."""
 
-from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request as StarletteRequest
+from fastapi import status
 from starlette.responses import Response
-from typing import Any, Callable, Optional, Dict
-
-from app.core.security.oauth2_scheme import oauth2_scheme
-from app.core.security.jwt import decode_access_token
-
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware para manejar la autenticación y códigos de estado HTTP."""
-    
-    async def dispatch(self, request: StarletteRequest, call_next: Callable) -> Response:
-        # Lista de rutas que no requieren autenticación
-        public_paths = ["/api/v1/auth/login", "/api/v1/docs", "/api/v1/openapi.json", "/openapi.json"]
-        
-        # Si la ruta es pública, continuar sin validar autenticación
-        if any(request.url.path.startswith(path) for path in public_paths):
-            return await call_next(request)
-            
-        # Verificar si la ruta es protegida (comienza con /api/v1/)
-        if request.url.path.startswith("/api/v1/"):
-            # Obtener el token del encabezado de autorización
-            authorization: str = request.headers.get("Authorization")
-            
-            # Si no hay token o está vacío, devolver 401 con mensaje específico
-            if not authorization or not authorization.strip():
-                return JSONResponse(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "No autenticado"},
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # Verificar el esquema de autenticación
-            try:
-                # Intentar dividir el esquema y el token
-                parts = authorization.split()
-                if len(parts) != 2 or parts[0].lower() != "bearer" or not parts[1]:
-                    return JSONResponse(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        content={"detail": "No autenticado"},
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                
-                # Validar el token JWT
-                token = parts[1]
-                payload = decode_access_token(token)
-                if not payload:
-                    return JSONResponse(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        content={"detail": "Could not validate credentials"},
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                
-                # Continuar con la solicitud si todo está bien
-                return await call_next(request)
-                
-            except Exception as e:
-                # Cualquier otro error inesperado, devolver 401 con mensaje de no autenticado
-                return JSONResponse(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "No autenticado"},
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-        
-        # Para rutas que no son API, continuar sin validación
-        return await call_next(request)
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.security.jwt import decode_access_token_cached
+from app.core.security.oauth2_scheme import bearer_token
+
+# Prefijos de rutas que no requieren autenticación (tupla: un solo startswith en C)
+PUBLIC_PATHS = (
+    "/api/v1/auth/login",
+    "/api/v1/docs",
+    "/api/v1/openapi.json",
+    "/openapi.json",
+)
+API_PREFIX = "/api/v1/"
+
+# Cuerpos 401 precalculados. Las ``Response`` se crean en cada llamada: un
+# middleware que envuelva a éste (p. ej. RequestLoggingMiddleware) añade
+# cabeceras sobre la lista de la respuesta y no debe tocar una compartida
+_NOT_AUTHENTICATED_BODY = b'{"detail":"No autenticado"}'
+_INVALID_CREDENTIALS_BODY = b'{"detail":"Could not validate credentials"}'
+_AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _unauth() -> Response:
+    """401 para requests sin token Bearer."""
+    return Response(
+        content=_NOT_AUTHENTICATED_BODY,
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        headers=_AUTH_HEADERS,
+        media_type="application/json",
+    )
+
+
+def _invalid_creds() -> Response:
+    """401 para tokens inválidos o expirados."""
+    return Response(
+        content=_INVALID_CREDENTIALS_BODY,
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        headers=_AUTH_HEADERS,
+        media_type="application/json",
+    )
+
+
+class AuthMiddleware:
+    """Middleware ASGI puro para manejar la autenticación y códigos de estado HTTP.
+
+    No hereda de ``BaseHTTPMiddleware``: así se evita el task group de anyio y
+    el stream en memoria que éste crea por request, y no se construye ningún
+    ``Request`` (la ruta y la cabecera se leen del ``scope``).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+
+        # Rutas públicas y rutas fuera de la API: continuar sin validar
+        if path.startswith(PUBLIC_PATHS) or not path.startswith(API_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        # Formato esperado "Bearer <jwt>" (mismo parseo que oauth2_scheme)
+        token = bearer_token(scope)
+        if token is None:
+            await _unauth()(scope, receive, send)
+            return
+
+        # Validar el token JWT
+        payload = decode_access_token_cached(token)
+        if not payload:
+            await _invalid_creds()(scope, receive, send)
+            return
+
+        # Compartir el resultado con oauth2_scheme/get_token_payload: Starlette
+        # expone ``scope["state"]`` como ``request.state``
+        state = scope.setdefault("state", {})
+        state["jwt_token"] = token
+        state["jwt_payload"] = payload
+
+        await self.app(scope, receive, send)
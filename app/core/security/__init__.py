@@ -3,24 +3,29 @@
 Este paquete proporciona utilidades para manejo de autenticación y seguridad,
 incluyendo hashing de contraseñas, generación de tokens JWT y esquemas OAuth2.
 """
-from fastapi.security import OAuth2PasswordBearer
-
 from .hashing import (
     PasswordHasher,
     Argon2PasswordHasher,
     default_password_hasher,
     verify_password,
     get_password_hash,
+    averify_password,
+    aget_password_hash,
+    password_needs_rehash,
+    hash_benchmark,
 )
-
-# La ruta del endpoint de login que entrega el token JWT
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
+from .oauth2_scheme import CustomOAuth2PasswordBearer, oauth2_scheme
 
 __all__ = [
     "oauth2_scheme",
+    "CustomOAuth2PasswordBearer",
     "PasswordHasher",
     "Argon2PasswordHasher",
     "default_password_hasher",
     "verify_password",
     "get_password_hash",
+    "averify_password",
+    "aget_password_hash",
+    "password_needs_rehash",
+    "hash_benchmark",
 ]
@@ -1,26 +1,84 @@
-
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Protocol
-from passlib.context import CryptContext
 
-# Contexto de hashing configurable
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+from argon2 import PasswordHasher as _Argon2Hasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+logger = logging.getLogger(__name__)
+
+# Parámetros Argon2id recomendados por OWASP (t=2, m=19 MiB, p=1)
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19456  # KiB
+ARGON2_PARALLELISM = 1
+ARGON2_HASH_LEN = 32
+ARGON2_SALT_LEN = 16
+
+# Umbral a partir del cual se avisa que el verify es demasiado lento en el host
+HASH_BENCHMARK_WARNING_MS = 250.0
+
+_ph = _Argon2Hasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=ARGON2_HASH_LEN,
+    salt_len=ARGON2_SALT_LEN,
+)
+
+# Pool dedicado al hashing: argon2-cffi libera el GIL, así que los hilos escalan
+# con los núcleos y las ráfagas de login no agotan el threadpool por defecto.
+hash_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="hash_pool"
+)
 
 class PasswordHasher(Protocol):
     """Protocolo para definir un hasher de contraseñas."""
-    
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool: ...
     def get_password_hash(self, password: str) -> str: ...
 
 class Argon2PasswordHasher:
-    """Implementación concreta de PasswordHasher usando Argon2."""
-    
+    """Implementación concreta de PasswordHasher usando Argon2 (argon2-cffi)."""
+
+    # Sin estado propio: el hasher compartido vive a nivel de módulo
+    __slots__ = ()
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verifica si la contraseña plana coincide con el hash."""
-        return bool(pwd_context.verify(plain_password, hashed_password))
-    
+        try:
+            return bool(_ph.verify(hashed_password, plain_password))
+        except (VerificationError, InvalidHashError):
+            return False
+
     def get_password_hash(self, password: str) -> str:
         """Genera el hash de una contraseña."""
-        return str(pwd_context.hash(password))
+        return _ph.hash(password)
+
+    async def averify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Versión asíncrona de ``verify_password`` ejecutada en ``hash_pool``."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            hash_pool, self.verify_password, plain_password, hashed_password
+        )
+
+    async def aget_password_hash(self, password: str) -> str:
+        """Versión asíncrona de ``get_password_hash`` ejecutada en ``hash_pool``."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(hash_pool, self.get_password_hash, password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Indica si el hash fue generado con parámetros distintos a los actuales.
+
+        Permite migrar de forma perezosa los hashes antiguos (p. ej. los creados
+        con los parámetros por defecto de passlib) en el siguiente login exitoso.
+        """
+        try:
+            return _ph.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return False
 
 # Instancia por defecto para facilitar el uso
 default_password_hasher = Argon2PasswordHasher()
@@ -33,3 +91,39 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     """Genera el hash de una contraseña."""
     return default_password_hasher.get_password_hash(password)
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Versión asíncrona de verify_password ejecutada en ``hash_pool``."""
+    return await default_password_hasher.averify_password(
+        plain_password, hashed_password
+    )
+
+async def aget_password_hash(password: str) -> str:
+    """Versión asíncrona de get_password_hash ejecutada en ``hash_pool``."""
+    return await default_password_hasher.aget_password_hash(password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Indica si el hash debe regenerarse con los parámetros actuales."""
+    return default_password_hasher.needs_rehash(hashed_password)
+
+def hash_benchmark() -> float:
+    """Mide el tiempo (en ms) de un verify Argon2 en el host actual.
+
+    Se ejecuta al arrancar la aplicación y emite un warning si supera
+    ``HASH_BENCHMARK_WARNING_MS`` para que operaciones pueda ajustar
+    ``ARGON2_MEMORY_COST``.
+    """
+    sample_hash = get_password_hash("benchmark-password")
+    start = time.perf_counter()
+    verify_password("benchmark-password", sample_hash)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms > HASH_BENCHMARK_WARNING_MS:
+        logger.warning(
+            "Verificación Argon2 lenta: %.1f ms (umbral %.0f ms). "
+            "Considera reducir ARGON2_MEMORY_COST.",
+            elapsed_ms,
+            HASH_BENCHMARK_WARNING_MS,
+        )
+    else:
+        logger.info("Verificación Argon2: %.1f ms", elapsed_ms)
+    return elapsed_ms
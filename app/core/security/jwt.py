@@ -1,30 +1,61 @@
+import hashlib
 import logging
-from datetime import UTC, datetime, timedelta
+import time
+from collections.abc import Mapping
+from datetime import timedelta
 from typing import Any
 
-from jose import jwt
-from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+import jwt
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 ALGORITHM = settings.ALGORITHM
+# Vigencia por defecto del token en segundos (precalculada al importar)
+_DEFAULT_EXP_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Caché de payloads ya verificados, indexada por el token completo
+DECODED_TOKEN_CACHE_TTL_SECONDS = 60.0
+DECODED_TOKEN_CACHE_MAXSIZE = 10_000
+# Margen antes de ``exp`` a partir del cual se vuelve a verificar el token
+DECODED_TOKEN_EXPIRY_MARGIN_SECONDS = 5.0
+_decoded_token_cache: dict[str, tuple[dict[str, Any], float]] = {}
+# Clave con la que se verificaron las entradas; si rota, la caché se vacía
+_decoded_token_cache_key: str | None = None
+
+def hmac_uses_openssl() -> bool:
+    """Indica si HS256 se calcula con el SHA-256 de OpenSSL.
+
+    PyJWT firma con ``hmac.new(key, msg, hashlib.sha256)``; cuando ``hashlib``
+    está enlazado a OpenSSL esto usa su HMAC nativo (con SHA-NI en CPUs
+    modernas). Un ``hashlib`` sin OpenSSL cae en la implementación interna de
+    CPython, varias veces más lenta.
+    """
+    return getattr(hashlib.sha256, "__module__", None) == "_hashlib"
 
 def create_access_token(
-    data: dict[str, Any], expires_delta: timedelta | None = None
+    sub: str,
+    expires_delta: timedelta | None = None,
+    extra: Mapping[str, Any] | None = None,
 ) -> str:
-    """Crea un token de acceso JWT con expiración."""
-    sub = data.get("sub")
-    if not isinstance(sub, str) or not sub:
+    """Crea un token de acceso JWT con expiración.
+
+    El payload se construye directamente (sin copiar un dict del llamador);
+    ``extra`` añade claims adicionales pero nunca sobrescribe ``sub`` ni ``exp``.
+    """
+    if not sub:
         raise ValueError("El token debe incluir un 'sub' válido como string no vacío")
 
-    to_encode = data.copy()
-    expire = datetime.now(UTC) + (
-        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # ``exp`` es un NumericDate: segundos desde epoch, sin pasar por datetime
+    expire = int(time.time()) + (
+        int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_EXP_SECONDS
     )
-    to_encode.update({"exp": expire})
+    payload: dict[str, Any] = {**extra} if extra else {}
+    payload["sub"] = sub
+    payload["exp"] = expire
 
-    return str(jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM))
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 def decode_access_token(token: str) -> dict[str, Any] | None:
     """Decodifica un token JWT y retorna el payload si es válido."""
@@ -33,6 +64,42 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
     except ExpiredSignatureError:
         logger.warning("JWT expirado")
         return None
-    except (JWTClaimsError, JWTError) as e:
-        logger.warning(f"Error de token JWT: {e}")
+    except InvalidTokenError as e:
+        logger.warning("Error de token JWT: %s", e)
+        return None
+
+def decode_access_token_cached(token: str) -> dict[str, Any] | None:
+    """Igual que ``decode_access_token`` pero reutiliza payloads ya verificados.
+
+    La verificación HS256 es local (no hay introspección remota), así que el
+    coste por request es el parseo y la firma; aquí se evita repetirlo mientras
+    el token siga vigente. Cada entrada caduca a los
+    ``DECODED_TOKEN_CACHE_TTL_SECONDS`` o poco antes del ``exp`` del token, lo
+    que ocurra primero. Los tokens inválidos no se cachean y toda la caché se
+    invalida si cambia ``settings.SECRET_KEY``.
+    """
+    global _decoded_token_cache_key
+    if settings.SECRET_KEY is not _decoded_token_cache_key:
+        _decoded_token_cache.clear()
+        _decoded_token_cache_key = settings.SECRET_KEY
+
+    now = time.time()
+    cached = _decoded_token_cache.get(token)
+    if cached is not None:
+        if cached[1] > now:
+            return cached[0]
+        del _decoded_token_cache[token]
+
+    payload = decode_access_token(token)
+    if payload is None:
         return None
+
+    expires_at = now + DECODED_TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        expires_at = min(expires_at, exp - DECODED_TOKEN_EXPIRY_MARGIN_SECONDS)
+    if expires_at > now:
+        if len(_decoded_token_cache) >= DECODED_TOKEN_CACHE_MAXSIZE:
+            _decoded_token_cache.clear()
+        _decoded_token_cache[token] = (payload, expires_at)
+    return payload
@@ -3,13 +3,35 @@
 Este módulo contiene la implementación de CustomOAuth2PasswordBearer y la instancia
 del esquema que se utiliza en toda la aplicación.
 """
-from fastapi import HTTPException, status, Request
-from fastapi.security import OAuth2PasswordBearer
-from fastapi.security.utils import get_authorization_scheme_param
+from fastapi import HTTPException, status
 from fastapi.openapi.models import OAuthFlows as OAuthFlowsModel
 from fastapi.security.oauth2 import OAuth2
-from typing import Optional, Dict, Any
+from typing import Optional, Dict
 from starlette.requests import Request as StarletteRequest
+from starlette.types import Scope
+
+# "bearer " empaquetado como entero de 7 bytes; OR 0x20 por byte pasa las
+# letras ASCII a minúsculas sin crear un str nuevo (el espacio no cambia)
+_BEARER_PREFIX = int.from_bytes(b"bearer ", "little")
+_ASCII_LOWER_MASK = int.from_bytes(b"\x20" * 7, "little")
+
+
+def bearer_token(scope: Scope) -> str | None:
+    """Extrae el token de ``Authorization: Bearer <jwt>`` leyendo el scope ASGI.
+
+    Compartido por ``AuthMiddleware`` y ``CustomOAuth2PasswordBearer``. El
+    esquema se compara sin distinguir mayúsculas sobre los bytes crudos de la
+    cabecera. Devuelve ``None`` si falta la cabecera, el esquema no es Bearer o
+    el token está vacío.
+    """
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme = int.from_bytes(value[:7], "little") | _ASCII_LOWER_MASK
+            if scheme != _BEARER_PREFIX:
+                return None
+            return value[7:].strip().decode("latin-1") or None
+    return None
+
 
 class CustomOAuth2PasswordBearer(OAuth2):
     """Extensión de OAuth2 para personalizar los mensajes de error y códigos de estado.
@@ -20,53 +42,45 @@ class CustomOAuth2PasswordBearer(OAuth2):
     
     def __init__(
         self,
-        tokenUrl: str,
+        tokenUrl: str | None = None,
         scheme_name: Optional[str] = None,
         scopes: Optional[Dict[str, str]] = None,
         auto_error: bool = True,
+        flows: OAuthFlowsModel | None = None,
     ):
-        if not scopes:
-            scopes = {}
-        flows = OAuthFlowsModel(password={"tokenUrl": tokenUrl, "scopes": scopes})
+        # Reutilizar un modelo de flows ya construido evita validarlo de nuevo
+        if flows is None:
+            if tokenUrl is None:
+                raise ValueError("Se requiere tokenUrl o flows")
+            flows = OAuthFlowsModel(
+                password={"tokenUrl": tokenUrl, "scopes": scopes or {}}
+            )
         super().__init__(flows=flows, scheme_name=scheme_name, auto_error=auto_error)
     
     async def __call__(self, request: StarletteRequest) -> Optional[str]:
-        # Obtener el header de autorización
-        authorization: str = request.headers.get("Authorization")
-        
-        # Si no hay header de autorización, lanzar 401
-        if not authorization:
-            if self.auto_error:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="No autenticado",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            return None
-            
-        try:
-            # Verificar el esquema de autenticación
-            scheme, param = get_authorization_scheme_param(authorization)
-            
-            # Si el esquema no es Bearer o no hay token, lanzar 401
-            if not authorization or scheme.lower() != "bearer" or not param:
-                raise ValueError("Formato de token inválido")
-                
-            return param
-            
-        except (ValueError, IndexError):
-            # Capturar errores de formato de token
-            if self.auto_error:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Could not validate credentials",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            return None
+        # Si AuthMiddleware ya validó la cabecera, reutilizar su token
+        token = getattr(request.state, "jwt_token", None)
+        if token:
+            return token
+
+        # Sin cabecera, esquema distinto de Bearer o token vacío: 401
+        token = bearer_token(request.scope)
+        if token is None and self.auto_error:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="No autenticado",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return token
 
 # La ruta del endpoint de login que entrega el token JWT
+LOGIN_TOKEN_URL = "/api/v1/auth/login"
+
+# Flows OAuth2 construidos una sola vez al importar
+LOGIN_FLOWS = OAuthFlowsModel(password={"tokenUrl": LOGIN_TOKEN_URL, "scopes": {}})
+
 oauth2_scheme = CustomOAuth2PasswordBearer(
-    tokenUrl="/api/v1/auth/login",
+    flows=LOGIN_FLOWS,
     auto_error=True,
     scheme_name="JWT"
 )
@@ -0,0 +1,6 @@
+"""Tipos compartidos por los repositorios SQLAlchemy."""
+from datetime import date, datetime
+from uuid import UUID
+
+# Type alias for accepted query filter values
+AcceptedQueryTypes = str | float | bool | UUID | datetime | date | None
@@ -5,10 +5,13 @@ Aquí puedes definir lógica genérica o utilidades compartidas por todos los re
 
 import logging
 import uuid
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Iterable, Mapping
+from typing import Any, Generic, TypeVar
 
 # Removed Mapped from here as it's not directly used after protocol removal
 from sqlalchemy import (
+    Select,
+    delete as sa_delete,
     select,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +26,72 @@ logger = logging.getLogger(__name__)
 # Since AppDBBase now defines the 'id' attribute, this is sufficient for mypy.
 T = TypeVar("T", bound=AppDBBase)
 
+# Filas por lote que el driver entrega al recorrer resultados en streaming
+STREAM_YIELD_PER = 500
+
+# Paginación por keyset de ``list``/``filter_by``: tamaño por defecto y máximo
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def keyset_page(
+    stmt: Select[Any], id_column: Any, limit: int, after_id: uuid.UUID | None
+) -> Select[Any]:
+    """Ordena por ``id_column`` y aplica el cursor ``after_id`` y el límite.
+
+    El límite se acota a ``[1, MAX_PAGE_SIZE]``. A diferencia de OFFSET, el
+    cursor usa el índice de la PK para saltar directamente a la página.
+    """
+    if after_id is not None:
+        stmt = stmt.where(id_column > after_id)
+    return stmt.order_by(id_column).limit(min(max(limit, 1), MAX_PAGE_SIZE))
+
+
+def filter_column(
+    columns: Mapping[str, Any], model_name: str, field: str, context: str = ""
+) -> Any:
+    """Resuelve ``field`` en el mapa nombre -> columna o lanza ``ValueError``.
+
+    ``columns`` es el mapa precalculado del repositorio: una búsqueda por clave
+    sirve a la vez de validación y de resolución. ``context`` se añade al final
+    del mensaje (p. ej. `` para contar``).
+    """
+    column = columns.get(field)
+    if column is None:
+        raise ValueError(
+            f"El campo '{field}' no existe en el modelo {model_name}{context}"
+        )
+    return column
+
+
+def filter_conditions(
+    columns: Mapping[str, Any], model_name: str, filters: Mapping[str, object]
+) -> list[Any]:
+    """Valida los filtros campo=valor y devuelve sus condiciones de igualdad."""
+    return [
+        filter_column(columns, model_name, field) == value
+        for field, value in filters.items()
+    ]
+
+
+# Columnas por clase de modelo; se calculan una sola vez por modelo
+_columns_cache: dict[type, Mapping[str, Any] | None] = {}
+
+
+def _model_columns(model: type) -> Mapping[str, Any] | None:
+    """Devuelve (memorizado) el mapa nombre -> columna real del modelo.
+
+    ``None`` indica que el modelo no tiene ``__table__``.
+    """
+    try:
+        return _columns_cache[model]
+    except KeyError:
+        table = getattr(model, "__table__", None)
+        columns = dict(table.columns.items()) if table is not None else None
+        _columns_cache[model] = columns
+        return columns
+
+
 class BaseRepository(Generic[T]):
     """
     Repositorio base genérico para operaciones CRUD sobre modelos SQLAlchemy.
@@ -32,6 +101,11 @@ class BaseRepository(Generic[T]):
     #   filtrar entidades.
     - Pensado para ser heredado por repositorios concretos de cada entidad.
     """
+
+    # Sin ``__dict__`` por instancia; las subclases que añadan atributos deben
+    # declarar sus propios ``__slots__``
+    __slots__ = ("model", "db", "_columns")
+
     def __init__(self, model: type[T], db: AsyncSession) -> None:
         """
         Inicializa el repositorio base.
@@ -42,6 +116,7 @@ class BaseRepository(Generic[T]):
         """
         self.model = model
         self.db = db
+        self._columns = _model_columns(model)
 
     async def get_by_id(self, id_: uuid.UUID) -> T | None:
         """
@@ -72,21 +147,75 @@ class BaseRepository(Generic[T]):
         Returns:
             Instancia agregada (con ID y campos autogenerados).
         """
+        # flush (sin commit ni refresh): el INSERT se envía y los defaults del
+        # lado Python quedan cargados; el commit lo hace ``UnitOfWork`` en el endpoint
         self.db.add(obj_in)
-        await self.db.commit()
-        await self.db.refresh(obj_in)
+        await self.db.flush()
         return obj_in
 
     async def delete(self, entity_id: uuid.UUID) -> None:
         """
         Elimina una entidad de la base de datos por su ID.
+
+        Un único ``DELETE`` (sin ``SELECT`` previo ni hidratar el objeto ORM);
+        las cascadas deben estar definidas en la base de datos (``ON DELETE``).
         Args:
             entity_id: UUID de la entidad a eliminar.
         """
-        obj = await self.get_by_id(entity_id)
-        if obj:
-            await self.db.delete(obj)
-            await self.db.commit()
+        await self.db.execute(sa_delete(self.model).where(self.model.id == entity_id))
+
+    async def bulk_delete(self, ids: Iterable[uuid.UUID]) -> None:
+        """
+        Elimina varias entidades por ID en un único round-trip.
+        Args:
+            ids: UUIDs de las entidades a eliminar.
+        """
+        id_list = list(ids)
+        if not id_list:
+            return
+        await self.db.execute(sa_delete(self.model).where(self.model.id.in_(id_list)))
+
+    async def iter_all(self) -> AsyncIterator[T]:
+        """
+        Recorre todas las entidades del modelo sin materializarlas en memoria.
+
+        Usa ``stream_scalars`` con ``yield_per`` para que el driver entregue las
+        filas por lotes (cursor del lado del servidor); quien consuma solo las
+        primeras N filas solo paga por esas N.
+        Yields:
+            Instancias del modelo, una a una.
+        """
+        stmt = select(self.model).execution_options(yield_per=STREAM_YIELD_PER)
+        async for obj in await self.db.stream_scalars(stmt):
+            yield obj
+
+    def _filtered_stmt(
+        self, skip: int, limit: int, filters: dict[str, object]
+    ) -> Select[tuple[T]]:
+        """Construye la consulta filtrada y paginada validando las columnas."""
+        columns = self._columns
+        if columns is None:
+            error_message = (
+                f"El modelo {self.model.__name__} "
+                "no tiene atributo __table__."
+            )
+            raise ValueError(error_message)
+        # Los filtros con valor ``None`` se ignoran (no se validan ni filtran)
+        active = {attr: value for attr, value in filters.items() if value is not None}
+        stmt = (
+            select(self.model)
+            .where(*filter_conditions(columns, self.model.__name__, active))
+            .offset(skip)
+            .limit(limit)
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            filtered = {k: v for k, v in filters.items() if k != "password"}
+            logger.debug(
+                f"[{self.model.__name__}] Filtros aplicados: {filtered}, "
+                f"skip={skip}, limit={limit}"
+            )
+        return stmt
 
     async def list_filtered(
         self, skip: int = 0, limit: int = 100, **filters: object
@@ -105,36 +234,23 @@ class BaseRepository(Generic[T]):
             ValueError: Si se intenta filtrar por un campo que no es columna real
             #   del modelo.
         """
-        stmt = select(self.model)
-        # Acceder a __table__ de forma segura
-        table = getattr(self.model, '__table__', None)
-        if table is None:
-            error_message = (
-                f"El modelo {self.model.__name__} "
-                "no tiene atributo __table__."
-            )
-            raise ValueError(error_message)
-        column_names = table.columns.keys()
-        for attr, value in filters.items():
-            if value is not None:
-                if attr not in column_names:
-                    msg_parts = []
-                    msg_parts.append("Fld '")
-                    msg_parts.append(attr)
-                    msg_parts.append("' inválida en ")
-                    msg_parts.append(self.model.__name__)
-                    msg_parts.append(".")
-                    error_message = "".join(msg_parts)
-                    raise ValueError(error_message)
-                stmt = stmt.where(getattr(self.model, attr) == value)
-        stmt = stmt.offset(skip).limit(limit)
-
-        if logger.isEnabledFor(logging.DEBUG):
-            filtered = {k: v for k, v in filters.items() if k != "password"}
-            logger.debug(
-                f"[{self.model.__name__}] Filtros aplicados: {filtered}, "
-                f"skip={skip}, limit={limit}"
-            )
-
+        stmt = self._filtered_stmt(skip, limit, filters)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
+
+    async def iter_filtered(
+        self, skip: int = 0, limit: int = 100, **filters: object
+    ) -> AsyncIterator[T]:
+        """
+        Versión en streaming de ``list_filtered`` (mismos filtros y validación).
+        Yields:
+            Instancias del modelo que cumplen los filtros, una a una.
+        Raises:
+            ValueError: Si se intenta filtrar por un campo que no es columna real
+            #   del modelo.
+        """
+        stmt = self._filtered_stmt(skip, limit, filters).execution_options(
+            yield_per=STREAM_YIELD_PER
+        )
+        async for obj in await self.db.stream_scalars(stmt):
+            yield obj
@@ -1,11 +1,25 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import UTC, datetime  # Asegúrate que UTC esté importado
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import delete as sql_delete
 from sqlalchemy import exists as sql_exists
-from sqlalchemy import func, select  # Para count y exists
+from sqlalchemy import update as sql_update
+from sqlalchemy import (  # Para count y exists
+    Select,
+    bindparam,
+    func,
+    insert,
+    select,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
 
+from app.crud.base import STREAM_YIELD_PER, filter_column, filter_conditions
 from app.database.models import Contact as ContactORM
 from app.domain.exceptions.base import EntityNotFoundError
 from app.domain.models.contact import (
@@ -13,6 +27,104 @@ from app.domain.models.contact import (
 )
 from app.domain.repositories.base import IContactRepository
 
+# Campos del ORM en el orden de ``ContactDomain.from_persisted``
+_ORM_FIELDS = attrgetter(
+    "id", "name", "email", "message", "is_read", "created_at", "updated_at"
+)
+
+# Mismas columnas para las lecturas de solo consulta: se seleccionan como filas
+# Core (tuplas) y no se hidratan objetos ORM ni se llena el identity map
+_READ_COLS = (
+    ContactORM.id,
+    ContactORM.name,
+    ContactORM.email,
+    ContactORM.message,
+    ContactORM.is_read,
+    ContactORM.created_at,
+    ContactORM.updated_at,
+)
+
+
+# Sufijo del mensaje de ``filter_column`` según el tipo de consulta
+_FILTER_CONTEXT = {
+    "select": "",
+    "count": " para contar",
+    "exists": " para verificar existencia",
+}
+
+
+def _filter_key(filters: dict[str, object]) -> tuple[tuple[str, bool], ...]:
+    """Clave de caché: campos ordenados y si su valor es ``None`` (IS NULL)."""
+    return tuple(sorted((field, value is None) for field, value in filters.items()))
+
+
+def _filter_params(filters: dict[str, object]) -> dict[str, object]:
+    """Valores de los ``bindparam`` (los ``None`` ya van como IS NULL)."""
+    return {
+        f"f_{field}": value for field, value in filters.items() if value is not None
+    }
+
+
+# Sentencias de lectura inmutables construidas una sola vez: los valores van como
+# ``bindparam`` y todas las llamadas comparten la misma entrada de la caché de
+# compilación de SQLAlchemy
+_STMT_LIST = select(*_READ_COLS).execution_options(yield_per=STREAM_YIELD_PER)
+# Consulta más frecuente: SQL textual tipado con ``_READ_COLS``; no hay árbol
+# que compilar y el driver (asyncpg) reutiliza el prepared statement por texto
+_STMT_BY_EMAIL = (
+    text(
+        "SELECT id, name, email, message, is_read, created_at, updated_at "
+        "FROM contacts WHERE email = :email"
+    )
+    .columns(*_READ_COLS)
+    .execution_options(yield_per=STREAM_YIELD_PER)
+)
+_STMT_UNREAD = (
+    select(*_READ_COLS)
+    .where(ContactORM.is_read.is_(False))
+    .order_by(ContactORM.created_at.desc())
+    .execution_options(yield_per=STREAM_YIELD_PER)
+)
+_STMT_BY_DATE_RANGE = (
+    select(*_READ_COLS)
+    .where(
+        ContactORM.created_at >= bindparam("start_date"),
+        ContactORM.created_at <= bindparam("end_date"),
+    )
+    .order_by(ContactORM.created_at)
+    .execution_options(yield_per=STREAM_YIELD_PER)
+)
+
+# Columnas filtrables del modelo (más el alias de dominio ``full_name``),
+# resueltas una sola vez: validación O(1) y sin ``getattr`` por consulta
+_FIELD_COLUMNS: dict[str, Any] = {
+    attr.key: getattr(ContactORM, attr.key)
+    for attr in ContactORM.__mapper__.column_attrs
+}
+_FIELD_COLUMNS["full_name"] = ContactORM.name
+
+
+# Consultas de filtrado precompiladas por combinación de campos: los valores
+# viajan como ``bindparam`` y SQLAlchemy reutiliza la misma sentencia (y su
+# entrada en la caché de compilación) en cada llamada.
+@lru_cache(maxsize=128)
+def _filter_stmt(kind: str, key: tuple[tuple[str, bool], ...]) -> Select[Any]:
+    """Construye (una vez por ``kind``/``key``) la consulta filtrada de contactos."""
+    conditions = []
+    for field, is_null in key:
+        column = filter_column(
+            _FIELD_COLUMNS, ContactORM.__name__, field, _FILTER_CONTEXT[kind]
+        )
+        conditions.append(
+            column.is_(None) if is_null else column == bindparam(f"f_{field}")
+        )
+
+    if kind == "count":
+        return select(func.count()).select_from(ContactORM).where(*conditions)
+    if kind == "exists":
+        return select(sql_exists(select(ContactORM.id).where(*conditions)))
+    return select(*_READ_COLS).where(*conditions)
+
 
 class ContactRepository(IContactRepository):
     def __init__(self, db: AsyncSession) -> None:
@@ -20,19 +132,12 @@ class ContactRepository(IContactRepository):
         self.model = ContactORM # Modelo SQLAlchemy
 
     def _to_domain(self, contact_orm: ContactORM) -> ContactDomain:
-        """Convierte un modelo ORM ContactORM a un modelo de dominio ContactDomain."""
-        # Mapeo de ContactORM a Contact (dominio)
-        return ContactDomain(
-            id=contact_orm.id, # Cambiado de entity_id a id
-            full_name=contact_orm.name,
-            # Corregido de full_name a name según el ORM
-            email=contact_orm.email,
-            # phone no está en el constructor de ContactDomain
-            message=contact_orm.message,
-            is_read=contact_orm.is_read,
-            created_at=contact_orm.created_at,
-            updated_at=contact_orm.updated_at
-        )
+        """Convierte un modelo ORM ContactORM a un modelo de dominio ContactDomain.
+
+        Las filas de la BD son de confianza: se reconstruyen sin re-validar y
+        los campos se extraen con un único ``attrgetter``.
+        """
+        return ContactDomain.from_persisted(*_ORM_FIELDS(contact_orm))
 
     async def get(self, entity_id: UUID) -> ContactDomain | None:
         contact_orm = await self.db.get(self.model, entity_id)
@@ -40,161 +145,181 @@ class ContactRepository(IContactRepository):
             return None
         return self._to_domain(contact_orm)
 
+    async def _stream_domain(
+        self, query: Executable, params: dict[str, Any] | None = None
+    ) -> list[ContactDomain]:
+        """Convierte filas ``_READ_COLS`` a dominio en una sola pasada.
+
+        Las sentencias ``_STMT_*`` ya llevan ``yield_per``: el cursor se lee por
+        lotes y cada fila (tupla Core) se desempaqueta directamente en
+        ``ContactDomain.from_persisted``.
+        """
+        return [
+            ContactDomain.from_persisted(*row)
+            async for row in await self.db.stream(query, params)
+        ]
+
     async def list(self) -> Sequence[ContactDomain]:
-        result = await self.db.execute(select(self.model))
-        return [self._to_domain(contact_orm) for contact_orm in result.scalars().all()]
+        return await self._stream_domain(_STMT_LIST)
 
-    async def create(self, entity: ContactDomain) -> ContactDomain:
-        # Convertir de dominio a ORM
-        # Asegúrate de que los campos coincidan con tu modelo ContactORM
-        contact_orm_data = {
+    async def iter_all(self) -> AsyncIterator[ContactDomain]:
+        """Como ``list`` pero entregando los contactos uno a uno.
+
+        La memoria queda acotada a un lote de ``STREAM_YIELD_PER`` filas, sin
+        objetos ORM ni identity map, independientemente del total de filas.
+        """
+        async for row in await self.db.stream(_STMT_LIST):
+            yield ContactDomain.from_persisted(*row)
+
+    def _to_row(self, entity: ContactDomain) -> dict[str, Any]:
+        """Convierte una entidad de dominio en los parámetros de un INSERT.
+
+        Siempre se generan las mismas claves para que SQLAlchemy reutilice el
+        INSERT compilado y agrupe todas las filas en un único round-trip.
+        """
+        return {
+            "id": entity.id,
             "name": entity.full_name,
             "email": entity.email,
             "message": entity.message,
-            "is_read": entity.is_read
-            # No incluimos id si es autogenerado o se pasa explícitamente
-            # y se maneja de forma diferente en tu modelo ORM.
-            # Si ContactORM espera 'id' en creación y 'entity.id' es del dominio
-            # es el que se debe usar, entonces inclúyelo:
-            # "id": entity.id,
+            "is_read": entity.is_read,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
         }
-        # Si el ID se genera en el dominio y debe pasarse al ORM:
-        if entity.id:
-             contact_orm_data["id"] = entity.id
 
-        contact_orm = self.model(**contact_orm_data)
-        self.db.add(contact_orm)
-        return self._to_domain(contact_orm)
+    async def bulk_create(
+        self, entities: Sequence[ContactDomain]
+    ) -> list[ContactDomain]:
+        """Inserta varios contactos con un único ``INSERT ... RETURNING``.
+
+        Se devuelven las columnas ``_READ_COLS`` (no la entidad ORM): los
+        valores generados llegan en la misma sentencia, sin ``refresh`` ni
+        objetos en el identity map.
+        """
+        if not entities:
+            return []
+        stmt = (
+            insert(self.model)
+            .returning(*_READ_COLS, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True)
+        )
+        result = await self.db.execute(stmt, [self._to_row(e) for e in entities])
+        return [ContactDomain.from_persisted(*row) for row in result]
+
+    async def create(self, entity: ContactDomain) -> ContactDomain:
+        created = await self.bulk_create([entity])
+        return created[0]
 
     async def update(self, entity: ContactDomain) -> ContactDomain:
-        contact_orm = await self.db.get(self.model, entity.id)
+        # Un único UPDATE ... RETURNING en lugar de SELECT + UPDATE
+        stmt = (
+            sql_update(self.model)
+            .where(self.model.id == entity.id)
+            .values(
+                name=entity.full_name,
+                email=entity.email,
+                message=entity.message,
+                is_read=entity.is_read,
+                updated_at=datetime.now(UTC),
+            )
+            .returning(self.model)
+        )
+        contact_orm = (await self.db.scalars(stmt)).one_or_none()
         if not contact_orm:
             raise EntityNotFoundError(entity="Contact", entity_id=str(entity.id))
-        
-        contact_orm.name = entity.full_name
-        contact_orm.email = entity.email
-        contact_orm.message = entity.message
-        contact_orm.is_read = entity.is_read
-        # El campo updated_at debería actualizarse automáticamente si está configurado
-        # en el ORM con onupdate=datetime.now(UTC) o similar.
-        # Si no, hazlo manual: contact_orm.updated_at = datetime.now(UTC)
         return self._to_domain(contact_orm)
 
     async def delete(self, entity_id: UUID) -> None:
-        contact_orm = await self.db.get(self.model, entity_id)
-        if not contact_orm:
+        # DELETE ... RETURNING id: sin cargar la fila para saber si existía
+        stmt = (
+            sql_delete(self.model)
+            .where(self.model.id == entity_id)
+            .returning(self.model.id)
+        )
+        if (await self.db.execute(stmt)).scalar_one_or_none() is None:
             raise EntityNotFoundError(entity="Contact", entity_id=str(entity_id))
-        await self.db.delete(contact_orm)
 
     async def get_by_email(self, email: str) -> Sequence[ContactDomain]:
-        query = select(self.model).where(self.model.email == email)
-        result = await self.db.execute(query)
-        contacts_orm = result.scalars().all()
-        return [self._to_domain(contact_orm) for contact_orm in contacts_orm]
+        return await self._stream_domain(_STMT_BY_EMAIL, {"email": email})
 
     async def get_by_field(
         self, field_name: str, value: object
     ) -> ContactDomain | None:
-        if not hasattr(self.model, field_name):
-            error_msg = (
-                f"El campo '{field_name}' no existe "
-                f"en el modelo {self.model.__name__}"
-            )
-            raise ValueError(error_msg)
-        query = select(self.model).where(getattr(self.model, field_name) == value)
-        result = await self.db.execute(query)
-        contact_orm = result.scalar_one_or_none()
-        return self._to_domain(contact_orm) if contact_orm else None
+        query = select(*_READ_COLS).where(
+            *filter_conditions(_FIELD_COLUMNS, self.model.__name__, {field_name: value})
+        )
+        row = (await self.db.execute(query)).one_or_none()
+        return ContactDomain.from_persisted(*row) if row else None
 
     async def filter_by(self, **filters: object) -> Sequence[ContactDomain]:
-        query = select(self.model)
         # Mapear 'full_name' a 'name' para la consulta ORM
         if "full_name" in filters:
             filters["name"] = filters.pop("full_name")
 
-        for field, value in filters.items():
-            if not hasattr(self.model, field):
-                error_msg = (
-                    f"El campo '{field}' no existe "
-                    f"en el modelo {self.model.__name__}"
-                )
-                raise ValueError(error_msg)
-            query = query.where(getattr(self.model, field) == value)
-        result = await self.db.execute(query)
-        return [self._to_domain(contact_orm) for contact_orm in result.scalars().all()]
+        stmt = _filter_stmt("select", _filter_key(filters))
+        result = await self.db.execute(stmt, _filter_params(filters))
+        return [ContactDomain.from_persisted(*row) for row in result]
 
     # Métodos de IRepository (get, list, create, update, delete, etc.)
 
     async def count(self, **filters: object) -> int:
-        # Construir la consulta con filtros, similar a filter_by pero con func.count
-        query = select(func.count()).select_from(self.model)
-        for field, value in filters.items():
-            if not hasattr(self.model, field):
-                # Opcional: devolver 0 o lanzar error específico
-                error_msg = (
-                    f"El campo '{field}' no existe en el modelo "
-                    f"{self.model.__name__} para contar"
-                )
-                raise ValueError(error_msg)
-            query = query.where(getattr(self.model, field) == value)
-        
-        result = await self.db.execute(query)
+        stmt = _filter_stmt("count", _filter_key(filters))
+        result = await self.db.execute(stmt, _filter_params(filters))
         count = result.scalar_one_or_none()
         return count if count is not None else 0
 
     async def exists(self, **criteria: object) -> bool:
-        # Construir la consulta con criterios, similar a filter_by pero con
-        # select(self.model.id).exists()
-        # o una consulta más optimizada si tu ORM lo permite.
-        # Solo necesitamos saber si existe, no traer toda la entidad
-        query = select(self.model.id)
-        for field, value in criteria.items():
-            if not hasattr(self.model, field):
-                raise ValueError(
-                    f"El campo '{field}' no existe en el modelo {self.model.__name__} "
-                    f"para verificar existencia"
-                )
-            query = query.where(getattr(self.model, field) == value)
-        
-        # Usar exists() de SQLAlchemy para una consulta más eficiente
-        exists_query = select(sql_exists(query))
-        result = await self.db.execute(exists_query)
+        # EXISTS sobre ``select(id)``: no se trae la entidad completa
+        stmt = _filter_stmt("exists", _filter_key(criteria))
+        result = await self.db.execute(stmt, _filter_params(criteria))
         return bool(result.scalar_one())
 
     # Métodos específicos de IContactRepository
 
     async def get_unread(self) -> Sequence[ContactDomain]:
-        query = select(self.model).where(self.model.is_read == False)  # noqa: E712
-        result = await self.db.execute(query)
-        contacts_orm = result.scalars().all()
-        return [self._to_domain(contact_orm) for contact_orm in contacts_orm]
+        # Más recientes primero; recorre el índice parcial
+        # ix_contacts_unread_created_at
+        return await self._stream_domain(_STMT_UNREAD)
 
     async def mark_as_read(self, contact_id: UUID) -> ContactDomain:
-        contact_orm = await self.db.get(self.model, contact_id)
-        if not contact_orm:
-            raise EntityNotFoundError(entity="Contact", entity_id=str(contact_id))
-        
-        if not contact_orm.is_read:
-            # Actualizar el campo y 'updated_at'
-            # Usar la instancia ORM directamente es más común si la sesión está activa
-            contact_orm.is_read = True
-            # Asegurar que UTC esté importado y datetime también
-            contact_orm.updated_at = datetime.now(UTC)
-            self.db.add(contact_orm) # Marcar para la sesión que el objeto ha cambiado
-
-        
+        # Solo actualiza si aún no estaba leído (un UPDATE ... RETURNING)
+        stmt = (
+            sql_update(self.model)
+            .where(self.model.id == contact_id, self.model.is_read.is_(False))
+            .values(is_read=True, updated_at=datetime.now(UTC))
+            .returning(self.model)
+        )
+        contact_orm = (await self.db.scalars(stmt)).one_or_none()
+        if contact_orm is None:
+            # Ya estaba leído (nada que actualizar) o no existe
+            contact_orm = await self.db.get(self.model, contact_id)
+            if not contact_orm:
+                raise EntityNotFoundError(entity="Contact", entity_id=str(contact_id))
         return self._to_domain(contact_orm)
 
+    async def mark_many_as_read(self, contact_ids: Iterable[UUID]) -> int:
+        """Marca varios contactos como leídos con un único UPDATE.
+
+        Solo toca las filas aún no leídas; devuelve cuántas cambiaron.
+        """
+        ids = list(contact_ids)
+        if not ids:
+            return 0
+        stmt = (
+            sql_update(self.model)
+            .where(self.model.id.in_(ids), self.model.is_read.is_(False))
+            .values(is_read=True, updated_at=datetime.now(UTC))
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        return len((await self.db.execute(stmt)).all())
+
     async def get_by_date_range(
         self, start_date: datetime, end_date: datetime
     ) -> Sequence[ContactDomain]:
         # Asegúrate que start_date y end_date sean conscientes de la zona horaria
         # si tu BD lo requiere
         # o que created_at en la BD también lo sea.
-        query = select(self.model).where(
-            self.model.created_at >= start_date,
-            self.model.created_at <= end_date
-        ).order_by(self.model.created_at)
-        result = await self.db.execute(query)
-        contacts_orm = result.scalars().all()
-        return [self._to_domain(contact_orm) for contact_orm in contacts_orm]
+        return await self._stream_domain(
+            _STMT_BY_DATE_RANGE, {"start_date": start_date, "end_date": end_date}
+        )
@@ -1,11 +1,13 @@
 """Repositorio de ContactRequest (implementaciones en memoria y SQLAlchemy)."""
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Sequence
-from typing import Final
+from operator import attrgetter
+from typing import Any, Final
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import ContactRequest as ContactRequestORM
@@ -14,19 +16,43 @@ from app.domain.repositories.contact_request import IContactRequestRepository
 
 __all__ = ["InMemoryContactRequestRepository", "SQLAlchemyContactRequestRepository"]
 
+# Campos del ORM en el orden de ``ContactRequest.from_persisted``
+_ORM_FIELDS = attrgetter(
+    "id", "full_name", "email", "phone", "message", "created_at", "updated_at"
+)
+
 
 class InMemoryContactRequestRepository(IContactRequestRepository):
-    """Simple almacenamiento en lista, útil para la versión sin DB."""
+    """Simple almacenamiento en lista, útil para la versión sin DB.
+
+    Mantiene además un índice por email para búsquedas O(1).
+    """
 
     def __init__(self) -> None:  # noqa: D401
         self._items: Final[list[ContactRequest]] = []
+        self._by_email: Final[defaultdict[str, list[ContactRequest]]] = (
+            defaultdict(list)
+        )
 
     async def create(self, contact_request: ContactRequest) -> ContactRequest:  # noqa: D401
         self._items.append(contact_request)
+        self._by_email[contact_request.email].append(contact_request)
         return contact_request
 
+    async def bulk_create(
+        self, contact_requests: Sequence[ContactRequest]
+    ) -> list[ContactRequest]:  # noqa: D401
+        self._items.extend(contact_requests)
+        for item in contact_requests:
+            self._by_email[item.email].append(item)
+        return list(contact_requests)
+
+    async def get_by_email(self, email: str) -> Sequence[ContactRequest]:  # noqa: D401
+        return tuple(self._by_email.get(email, ()))
+
     async def list(self) -> Sequence[ContactRequest]:  # noqa: D401
-        return list(self._items)
+        # Copia superficial inmutable: el llamador no puede alterar el almacén
+        return tuple(self._items)
 
 
 class SQLAlchemyContactRequestRepository(IContactRequestRepository):
@@ -37,43 +63,62 @@ class SQLAlchemyContactRequestRepository(IContactRequestRepository):
         self.model = ContactRequestORM
 
     def _to_domain(self, orm_model: ContactRequestORM) -> ContactRequest:
-        """Convierte un modelo ORM a modelo de dominio."""
-        return ContactRequest(
-            full_name=orm_model.full_name,
-            email=orm_model.email,
-            message=orm_model.message,
-            phone=orm_model.phone,
-            entity_id=orm_model.id,
-            created_at=orm_model.created_at,
-            updated_at=orm_model.updated_at,
+        """Convierte un modelo ORM a modelo de dominio (sin re-validar).
+
+        Los campos se extraen con un único ``attrgetter`` (implementado en C).
+        """
+        return ContactRequest.from_persisted(*_ORM_FIELDS(orm_model))
+
+    def _to_row(self, contact_request: ContactRequest) -> dict[str, Any]:
+        """Parámetros del INSERT (mismas claves siempre, ver ``bulk_create``)."""
+        return {
+            "id": contact_request.id,
+            "full_name": contact_request.full_name,
+            "email": contact_request.email,
+            "phone": contact_request.phone,
+            "message": contact_request.message,
+            "is_processed": False,
+            "created_at": contact_request.created_at,
+            "updated_at": contact_request.updated_at,
+        }
+
+    async def bulk_create(
+        self, contact_requests: Sequence[ContactRequest]
+    ) -> list[ContactRequest]:
+        """Guarda varias solicitudes con un único ``INSERT ... RETURNING``.
+
+        ``render_nulls`` mantiene ``phone=None`` dentro del mismo lote en lugar
+        de partir el INSERT por cada combinación de columnas nulas.
+        """
+        if not contact_requests:
+            return []
+        stmt = (
+            insert(self.model)
+            .returning(self.model, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True)
         )
+        result = await self.db.scalars(
+            stmt, [self._to_row(item) for item in contact_requests]
+        )
+        return [self._to_domain(orm) for orm in result.all()]
 
     async def create(self, contact_request: ContactRequest) -> ContactRequest:
         """Guarda una solicitud de contacto en la base de datos."""
-        # Creamos una instancia del ORM
-        contact_request_orm = self.model(
-            id=contact_request.id,
-            full_name=contact_request.full_name,
-            email=contact_request.email,
-            phone=contact_request.phone,
-            message=contact_request.message,
-            is_processed=False,
-            created_at=contact_request.created_at,
-            updated_at=contact_request.updated_at,
-        )
-        
-        # La añadimos a la sesión y hacemos flush para generar el ID
-        self.db.add(contact_request_orm)
-        await self.db.flush()
-        
-        # Devolvemos un objeto de dominio
-        return self._to_domain(contact_request_orm)
+        created = await self.bulk_create([contact_request])
+        return created[0]
     
     async def list(self) -> Sequence[ContactRequest]:
         """Devuelve todas las solicitudes de contacto."""
         result = await self.db.execute(select(self.model))
         return [self._to_domain(orm) for orm in result.scalars().all()]
     
+    async def get_by_email(self, email: str) -> Sequence[ContactRequest]:
+        """Devuelve las solicitudes enviadas desde ``email``."""
+        result = await self.db.execute(
+            select(self.model).where(self.model.email == email)
+        )
+        return [self._to_domain(orm) for orm in result.scalars()]
+
     async def get_by_id(self, entity_id: UUID) -> ContactRequest | None:
         """Obtiene una solicitud de contacto por su ID."""
         contact_request_orm = await self.db.get(self.model, entity_id)
@@ -1,18 +1,39 @@
-from collections.abc import Sequence
-from datetime import date, datetime
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import exists as sql_exists
+from sqlalchemy import update as sql_update
+from sqlalchemy import bindparam, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud._types import AcceptedQueryTypes
+from app.crud.base import (
+    DEFAULT_PAGE_SIZE,
+    STREAM_YIELD_PER,
+    filter_conditions,
+    keyset_page,
+)
 from app.database.models import Role
 from app.domain.exceptions.base import EntityNotFoundError  # Modelo de Dominio
 from app.domain.models.role import Role as RoleDomain
 from app.domain.repositories.base import IRoleRepository
 
-# Type alias for accepted query filter values
-AcceptedQueryTypes = str | float | bool | UUID | datetime | date | None
+# Columnas devueltas por ``bulk_create`` en el orden del constructor de dominio
+_RETURNING_COLS = (Role.id, Role.name, Role.description, Role.created_at)
+
+# Sentencias de lectura inmutables construidas una sola vez; los valores van
+# como ``bindparam`` (mismo patrón que ``app.crud.contact``)
+_STMT_LIST = select(Role)
+_STMT_ITER = _STMT_LIST.execution_options(yield_per=STREAM_YIELD_PER)
+_STMT_BY_NAME = select(Role).where(Role.name == bindparam("name"))
+
+# Columnas filtrables del modelo resueltas una sola vez: validación O(1) y sin
+# ``hasattr``/``getattr`` sobre el mapper en cada consulta
+_FIELD_COLUMNS: dict[str, Any] = {
+    attr.key: getattr(Role, attr.key) for attr in Role.__mapper__.column_attrs
+}
 
 
 class RoleRepositoryImpl(IRoleRepository):
@@ -33,113 +54,124 @@ class RoleRepositoryImpl(IRoleRepository):
         )
 
     async def get(self, entity_id: UUID) -> RoleDomain | None:
-        query = select(self.model).where(self.model.id == entity_id)
-        result = await self.db.execute(query)
-        role_orm = result.scalar_one_or_none()
+        # session.get consulta primero el identity map: si el rol ya se cargó
+        # (o se actualizó con UPDATE ... RETURNING) en esta request, no hay SELECT
+        role_orm = await self.db.get(self.model, entity_id)
         return self._to_domain(role_orm) if role_orm else None
 
-    async def list(self) -> Sequence[RoleDomain]:
-        query = select(self.model)
-        result = await self.db.execute(query)
-        return [self._to_domain(role_orm) for role_orm in result.scalars().all()]
-
-    async def create(self, entity: RoleDomain) -> RoleDomain:
-        # Convertir de dominio a ORM
-        # El ID se toma directamente de la entidad de dominio (entity.id),
-        # que garantiza que siempre sea un UUID.
-        # `RoleDomain` hereda `id` de `Entity`,
-        # y `Entity` asegura que `id` sea un UUID
-        # (ya sea el `entity_id` proporcionado o uno nuevo).
-        # permissions no se maneja aquí directamente si no está
-        # en el constructor de RoleORM o RoleDomain
-        role_orm_data: dict[str, Any] = {
+    async def list(
+        self, *, limit: int = DEFAULT_PAGE_SIZE, after_id: UUID | None = None
+    ) -> Sequence[RoleDomain]:
+        """Lista una página de roles ordenada por id (ver ``filter_by``)."""
+        return await self.filter_by(limit=limit, after_id=after_id)
+
+    async def iter_all(self) -> AsyncIterator[RoleDomain]:
+        """Como ``list`` pero en streaming: lotes de ``STREAM_YIELD_PER`` filas."""
+        async for role_orm in await self.db.stream_scalars(_STMT_ITER):
+            yield self._to_domain(role_orm)
+
+    def _to_row(self, entity: RoleDomain) -> dict[str, Any]:
+        """Parámetros del INSERT (mismas claves siempre, ver ``bulk_create``)."""
+        return {
+            "id": entity.id,
             "name": entity.name,
             "description": entity.description,
-            "id": entity.id
+            "created_at": entity.created_at,
         }
-        
-        role_orm = self.model(**role_orm_data)
-        self.db.add(role_orm)
-        return self._to_domain(role_orm)
+
+    async def bulk_create(self, entities: Sequence[RoleDomain]) -> list[RoleDomain]:
+        """Inserta varios roles con un único ``INSERT ... RETURNING``.
+
+        SQLAlchemy agrupa las filas en sentencias multi-VALUES por páginas
+        (``insertmanyvalues``), así que no hace falta trocear a mano para
+        respetar el límite de parámetros de PostgreSQL.
+        """
+        if not entities:
+            return []
+        stmt = insert(self.model).returning(
+            *_RETURNING_COLS, sort_by_parameter_order=True
+        )
+        result = await self.db.execute(stmt, [self._to_row(e) for e in entities])
+        return [
+            RoleDomain(
+                id=id_, name=name, description=description, created_at=created_at
+            )
+            for id_, name, description, created_at in result
+        ]
+
+    async def create(self, entity: RoleDomain) -> RoleDomain:
+        created = await self.bulk_create([entity])
+        return created[0]
 
     async def update(self, entity: RoleDomain) -> RoleDomain:
-        role_orm = await self.db.get(self.model, entity.id)
+        # Un único UPDATE ... RETURNING: sin SELECT previo para saber si existe
+        stmt = (
+            sql_update(self.model)
+            .where(self.model.id == entity.id)
+            .values(name=entity.name, description=entity.description or "")
+            .returning(self.model)
+        )
+        role_orm = (await self.db.scalars(stmt)).one_or_none()
         if not role_orm:
-            # Asegúrate que EntityNotFoundError pueda tomar estos argumentos o ajústalo
             raise EntityNotFoundError(entity="Rol", entity_id=entity.id)
-
-        role_orm.name = entity.name
-        # Asegurar que no sea None si el ORM no lo permite
-        role_orm.description = entity.description or ""
-        # role_orm.permissions = entity.permissions # Omitir si no se maneja
-        # updated_at se manejará automáticamente si está configurado en el modelo ORM
         return self._to_domain(role_orm)
 
     # Ajustado a la interfaz IRepository
     async def delete(self, entity_id: UUID) -> None:
-        role_orm = await self.db.get(self.model, entity_id)
-        if not role_orm:
+        # DELETE ... RETURNING sin hidratar la fila; las asignaciones de
+        # user_roles las elimina el ON DELETE CASCADE de la FK
+        stmt = (
+            sql_delete(self.model)
+            .where(self.model.id == entity_id)
+            .returning(self.model.id)
+        )
+        if (await self.db.execute(stmt)).scalar_one_or_none() is None:
             raise EntityNotFoundError(entity="Rol", entity_id=str(entity_id))
-        await self.db.delete(role_orm)
-
-    async def count(self, **filters: str | float | bool | UUID | datetime | date | None) -> int:
-        query = select(self.model)
-        for field, value in filters.items():
-            if not hasattr(self.model, field):
-                model_name = self.model.__name__
-                raise ValueError(
-                    f"El campo '{field}' no existe en el modelo {model_name}"
-                )
-            query = query.where(getattr(self.model, field) == value)
+
+    async def count(self, **filters: AcceptedQueryTypes) -> int:
+        # COUNT(*) en la base de datos: no se transfieren ni hidratan filas
+        query = (
+            select(func.count())
+            .select_from(self.model)
+            .where(*filter_conditions(_FIELD_COLUMNS, self.model.__name__, filters))
+        )
         result = await self.db.execute(query)
-        return len(result.scalars().all())
-
-    async def exists(self, **filters: str | float | bool | UUID | datetime | date | None) -> bool:
-        query = select(self.model)
-        for field, value in filters.items():
-            if not hasattr(self.model, field):
-                model_name = self.model.__name__
-                raise ValueError(
-                    f"El campo '{field}' no existe en el modelo {model_name}"
-                )
-            query = query.where(getattr(self.model, field) == value)
+        return result.scalar_one()
+
+    async def exists(self, **filters: AcceptedQueryTypes) -> bool:
+        # SELECT EXISTS(...): la base de datos se detiene en la primera coincidencia
+        conditions = filter_conditions(_FIELD_COLUMNS, self.model.__name__, filters)
+        query = select(sql_exists(select(self.model.id).where(*conditions)))
         result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar_one())
 
     async def get_by_field(
-        self, field_name: str, value: str | float | bool | UUID | datetime | date | None
+        self, field_name: str, value: AcceptedQueryTypes
     ) -> RoleDomain | None:
-        # Implementación basada en la lógica de otros repositorios
-        if not hasattr(self.model, field_name):
-            # Opcional: devolver None o lanzar error específico
-            # si el campo no es del modelo,
-            # en lugar de un ValueError genérico.
-            # Mantenemos ValueError por consistencia si el campo no existe.
-            model_name = self.model.__name__
-            raise ValueError(
-                f"El campo '{field_name}' no existe "
-                f"en el modelo {model_name}"
-            )
-        query = select(self.model).where(getattr(self.model, field_name) == value)
+        query = _STMT_LIST.where(
+            *filter_conditions(_FIELD_COLUMNS, self.model.__name__, {field_name: value})
+        )
         result = await self.db.execute(query)
         role_orm = result.scalar_one_or_none()
         return self._to_domain(role_orm) if role_orm else None
 
-    async def filter_by(self, **filters: str | float | bool | UUID | datetime | date | None) -> Sequence[RoleDomain]:
-        query = select(self.model)
-        for field, value in filters.items():
-            if not hasattr(self.model, field):
-                model_name = self.model.__name__
-                raise ValueError(
-                    f"El campo '{field}' no existe en el modelo {model_name}"
-                )
-            query = query.where(getattr(self.model, field) == value)
+    async def filter_by(
+        self,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after_id: UUID | None = None,
+        **filters: AcceptedQueryTypes,
+    ) -> Sequence[RoleDomain]:
+        """Filtra roles paginando por keyset (``limit`` acotado, ``after_id``)."""
+        query = _STMT_LIST.where(
+            *filter_conditions(_FIELD_COLUMNS, self.model.__name__, filters)
+        )
+        query = keyset_page(query, self.model.id, limit, after_id)
         result = await self.db.execute(query)
         return [self._to_domain(role_orm) for role_orm in result.scalars().all()]
 
     async def get_by_name(self, name: str) -> RoleDomain | None:
-        query = select(self.model).where(self.model.name == name)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_STMT_BY_NAME, {"name": name})
         role_orm = result.scalar_one_or_none()
         return self._to_domain(role_orm) if role_orm else None
 
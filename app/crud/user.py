@@ -1,24 +1,90 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from operator import attrgetter
 from typing import Any
-from datetime import UTC, date, datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select, delete as sa_delete
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import exists as sa_exists
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
+from app.crud._types import AcceptedQueryTypes
+from app.crud.base import (
+    DEFAULT_PAGE_SIZE,
+    STREAM_YIELD_PER,
+    filter_conditions,
+    keyset_page,
+)
 from app.database.models import User as UserORM
 from app.domain.exceptions.base import EntityNotFoundError
 from app.domain.models.user import User
 from app.domain.repositories.base import IUserRepository
 
-# Type alias for accepted query filter values
-AcceptedQueryTypes = str | float | bool | UUID | datetime | date | None
+# A partir de este número de filas ``bulk_copy`` usa COPY en lugar de INSERT
+COPY_THRESHOLD = 1000
+
+# Columnas que escribe ``bulk_copy``: COPY no aplica los ``default`` de Python
+# del modelo, así que van todas explícitas
+_COPY_COLUMNS = (
+    "id", "email", "hashed_password", "full_name", "is_active",
+    "is_superuser", "is_deleted", "created_at", "updated_at",
+)
+
+# Columnas que usa ``User`` de dominio, en el orden de ``User.from_persisted``.
+# Las lecturas de listados las seleccionan como filas Core (tuplas): sin
+# objetos ORM, identity map ni carga perezosa posible
+_READ_COLS = (
+    UserORM.id,
+    UserORM.email,
+    UserORM.full_name,
+    UserORM.is_active,
+    UserORM.is_superuser,
+)
+
+# Los INSERT devuelven además las marcas de tiempo realmente escritas
+_INSERT_RETURNING = (*_READ_COLS, UserORM.created_at, UserORM.updated_at)
+
+# Mismos campos leídos de una instancia ORM con un único ``attrgetter``
+_ORM_FIELDS = attrgetter("id", "email", "full_name", "is_active", "is_superuser")
+
+# Las cargas de entidades ORM (``get``) solo traen las columnas que usa
+# ``_to_domain``: ni el hash de la contraseña ni las marcas de tiempo.
+# ``raiseload("*")`` hace que cualquier acceso perezoso a una relación (p. ej.
+# ``roles``) falle en lugar de lanzar un SELECT oculto por usuario (N+1).
+_DOMAIN_OPTIONS = (load_only(*_READ_COLS), raiseload("*"))
+
+# Sentencias de lectura inmutables construidas una sola vez; los valores van
+# como ``bindparam`` (mismo patrón que ``app.crud.contact``)
+_STMT_BY_EMAIL = select(*_READ_COLS).where(UserORM.email == bindparam("email"))
+_STMT_LIST = select(*_READ_COLS)
+_STMT_ITER = _STMT_LIST.execution_options(yield_per=STREAM_YIELD_PER)
+_STMT_ACTIVE = select(*_READ_COLS).where(UserORM.is_active)
+_STMT_HASH_BY_EMAIL = select(UserORM.hashed_password).where(
+    UserORM.email == bindparam("email")
+)
+# Misma consulta en SQL nativo para ``fetchval`` de asyncpg (ruta del login);
+# se resuelve con el índice cubriente ix_users_email_hpw
+_SQL_HASH_BY_EMAIL = "SELECT hashed_password FROM users WHERE email = $1"
+
+# Columnas filtrables del modelo resueltas una sola vez: validación O(1) y sin
+# ``hasattr``/``getattr`` sobre el mapper en cada consulta
+_FIELD_COLUMNS: dict[str, Any] = {
+    attr.key: getattr(UserORM, attr.key) for attr in UserORM.__mapper__.column_attrs
+}
 
 
 class UserRepository(IUserRepository):
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
         self.model = UserORM
+        # Caché de lectura por request: el repositorio se crea una vez por
+        # request (dependencias de FastAPI), así que las búsquedas repetidas
+        # de la misma clave no vuelven a consultar y nada se comparte entre
+        # requests. Se vacía en cualquier escritura que cambie el dominio.
+        self._cache: dict[tuple[str, object], User] = {}
         
         # Asegurarnos que db es una sesión válida
         if not isinstance(db, AsyncSession):
@@ -27,24 +93,18 @@ class UserRepository(IUserRepository):
     def _to_domain(self, user_orm: UserORM) -> User:
         """Convierte una instancia ORM a la entidad de dominio User.
 
-        Incluimos el *hashed_password* porque algunos flujos (p. ej. autenticación)
-        necesitan verificar la contraseña.  Mantener este dato dentro del modelo
-        de dominio simplifica la API del repositorio y evita tener que devolver
-        tuplas u otras estructuras ad-hoc.
+        El hash de la contraseña no forma parte de la entidad devuelta: la
+        autenticación lo obtiene aparte con ``get_hashed_password_by_email``.
+        Los campos se extraen con un único ``attrgetter`` (sin revalidar).
         """
-        return User(
-            id=user_orm.id,
-            email=user_orm.email,
-            full_name=user_orm.full_name or "",
-            is_active=user_orm.is_active,
-            is_superuser=bool(getattr(user_orm, "is_superuser", False)),
-        )
+        return User.from_persisted(*_ORM_FIELDS(user_orm))
 
     async def create(self, entity: User, hashed_password: str | None = None) -> User:
-        """Crea un usuario y lo persiste en la base de datos.
+        """Crea un usuario con un único ``INSERT ... RETURNING``.
 
-        Solo se incluyen en el ORM los campos válidos para evitar errores de
-        parámetros inesperados.
+        El id y las marcas de tiempo generados por los ``default`` del modelo
+        vuelven en la misma sentencia, sin pasar por la unidad de trabajo del
+        ORM ni un SELECT posterior.
         """
         user_data: dict[str, Any] = {
             "email": entity.email,
@@ -55,19 +115,95 @@ class UserRepository(IUserRepository):
         if hashed_password is not None:
             user_data["hashed_password"] = hashed_password
 
-        user_orm = UserORM(**user_data)
-        self.db.add(user_orm)
-        await self.db.flush()
-        await self.db.refresh(user_orm)
-        return self._to_domain(user_orm)
+        stmt = insert(self.model).values(**user_data).returning(*_INSERT_RETURNING)
+        row = (await self.db.execute(stmt)).one()
+        return User.from_persisted(*row)
 
-    async def get_by_email(self, email: str) -> User | None:
-        result = await self.db.execute(
-            select(self.model).where(self.model.email == email)
+    async def bulk_create(
+        self, entities: Sequence[User], hashed_passwords: Sequence[str]
+    ) -> list[User]:
+        """Inserta varios usuarios con un único ``INSERT ... RETURNING``.
+
+        ``hashed_passwords`` va en paralelo a ``entities`` (la columna es
+        obligatoria). SQLAlchemy pagina las filas en sentencias multi-VALUES.
+        """
+        if len(entities) != len(hashed_passwords):
+            raise ValueError("Se requiere un hashed_password por cada usuario")
+        if not entities:
+            return []
+        rows = [
+            {
+                "id": entity.id,
+                "email": entity.email,
+                "full_name": entity.full_name,
+                "is_active": entity.is_active,
+                "is_superuser": entity.is_superuser,
+                "hashed_password": hashed_password,
+            }
+            for entity, hashed_password in zip(entities, hashed_passwords, strict=True)
+        ]
+        stmt = insert(self.model).returning(
+            *_INSERT_RETURNING, sort_by_parameter_order=True
         )
-        user_orm = result.scalars().first()
-        if user_orm:
-            return self._to_domain(user_orm)
+        result = await self.db.execute(stmt, rows)
+        return [User.from_persisted(*row) for row in result]
+
+    async def bulk_copy(
+        self, entities: Sequence[User], hashed_passwords: Sequence[str]
+    ) -> list[User]:
+        """Carga masiva de usuarios con ``COPY`` (protocolo binario de asyncpg).
+
+        COPY evita el parseo/planificación por fila de los INSERT. Por debajo de
+        ``COPY_THRESHOLD`` filas, o con un driver distinto de asyncpg, delega en
+        ``bulk_create``. Devuelve los usuarios creados como ``bulk_create``;
+        en la ruta COPY son las propias entidades, ya que todas las columnas
+        se escriben explícitamente desde ellas.
+        """
+        if len(entities) != len(hashed_passwords):
+            raise ValueError("Se requiere un hashed_password por cada usuario")
+        conn = await self.db.connection()
+        if len(entities) < COPY_THRESHOLD or conn.dialect.driver != "asyncpg":
+            return await self.bulk_create(entities, hashed_passwords)
+
+        records = [
+            (
+                entity.id,
+                entity.email,
+                hashed_password,
+                entity.full_name,
+                entity.is_active,
+                entity.is_superuser,
+                False,
+                entity.created_at,
+                entity.updated_at,
+            )
+            for entity, hashed_password in zip(entities, hashed_passwords, strict=True)
+        ]
+        raw = await conn.get_raw_connection()
+        driver_conn = raw.driver_connection
+        # El adaptador asyncpg abre la transacción de forma perezosa con la
+        # primera sentencia que pasa por SQLAlchemy; sin ella el COPY iría en
+        # autocommit y un rollback de la sesión no lo desharía
+        if not driver_conn.is_in_transaction():
+            await conn.execute(select(1))
+        await driver_conn.copy_records_to_table(
+            self.model.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+        return list(entities)
+
+    def _remember(self, user: User) -> User:
+        self._cache["id", user.id] = user
+        self._cache["email", user.email] = user
+        return user
+
+    async def get_by_email(self, email: str) -> User | None:
+        cached = self._cache.get(("email", email))
+        if cached is not None:
+            return cached
+        result = await self.db.execute(_STMT_BY_EMAIL, {"email": email})
+        row = result.first()
+        if row is not None:
+            return self._remember(User.from_persisted(*row))
         return None
 
     async def get(self, entity_id: UUID) -> User:
@@ -76,58 +212,64 @@ class UserRepository(IUserRepository):
         Lanza EntityNotFoundError si no existe para que las capas superiores no
         necesiten volver a validar.
         """
-        user_orm = await self.db.get(self.model, entity_id)
+        cached = self._cache.get(("id", entity_id))
+        if cached is not None:
+            return cached
+        user_orm = await self.db.get(self.model, entity_id, options=_DOMAIN_OPTIONS)
         if not user_orm:
             raise EntityNotFoundError(entity="Usuario", entity_id=str(entity_id))
-        return self._to_domain(user_orm)
+        return self._remember(self._to_domain(user_orm))
+
+    async def list(
+        self, *, limit: int = DEFAULT_PAGE_SIZE, after_id: UUID | None = None
+    ) -> Sequence[User]:
+        """Lista una página de usuarios ordenada por id (ver ``filter_by``)."""
+        return await self.filter_by(limit=limit, after_id=after_id)
 
-    async def list(self) -> Sequence[User]:
-        """Lista todos los usuarios."""
-        result = await self.db.execute(select(self.model))
-        return [self._to_domain(user_orm) for user_orm in result.scalars().all()]
+    async def iter_all(self) -> AsyncIterator[User]:
+        """Como ``list`` pero en streaming: lotes de ``STREAM_YIELD_PER`` filas."""
+        async for row in await self.db.stream(_STMT_ITER):
+            yield User.from_persisted(*row)
 
     async def get_by_field(
-        self, field_name: str, value: str | float | bool | UUID | datetime | date | None
+        self, field_name: str, value: AcceptedQueryTypes
     ) -> User | None:
         """Obtiene un usuario por un campo específico."""
-        if not hasattr(self.model, field_name):
-            model_name = self.model.__name__
-            raise ValueError(
-                f"El campo {field_name} no existe "
-                f"en el modelo {model_name}"
-            )
-        query = select(self.model).where(getattr(self.model, field_name) == value)
-        result = await self.db.execute(query)
-        user_orm = result.scalar_one_or_none()
-        return self._to_domain(user_orm) if user_orm else None
-
-    async def filter_by(self, **filters: str | float | bool | UUID | datetime | date | None) -> Sequence[User]:
-        """Filtra usuarios basados en criterios."""
-        query = select(self.model)
-        for field, value in filters.items():
-            if not hasattr(self.model, field):
-                model_name = self.model.__name__
-                raise ValueError(
-                    f"El campo {field} no existe "
-                    f"en el modelo {model_name}"
-                )
-            query = query.where(getattr(self.model, field) == value)
+        query = _STMT_LIST.where(
+            *filter_conditions(_FIELD_COLUMNS, self.model.__name__, {field_name: value})
+        )
+        row = (await self.db.execute(query)).one_or_none()
+        return User.from_persisted(*row) if row is not None else None
+
+    async def filter_by(
+        self,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after_id: UUID | None = None,
+        **filters: AcceptedQueryTypes,
+    ) -> Sequence[User]:
+        """Filtra usuarios basados en criterios, paginando por keyset.
+
+        Devuelve como mucho ``limit`` usuarios (acotado a ``MAX_PAGE_SIZE``)
+        con id mayor que ``after_id``; para la página siguiente se pasa el id
+        del último usuario recibido.
+        """
+        query = _STMT_LIST.where(
+            *filter_conditions(_FIELD_COLUMNS, self.model.__name__, filters)
+        )
+        query = keyset_page(query, self.model.id, limit, after_id)
         result = await self.db.execute(query)
-        return [self._to_domain(user_orm) for user_orm in result.scalars().all()]
+        return [User.from_persisted(*row) for row in result]
 
     async def get_active(self) -> Sequence[User]:
-        result = await self.db.execute(
-            select(self.model).where(self.model.is_active)
-        )
-        users_orm = result.scalars().all()
-        return [self._to_domain(user_orm) for user_orm in users_orm]
+        result = await self.db.execute(_STMT_ACTIVE)
+        return [User.from_persisted(*row) for row in result]
 
     async def get_by_role(self, role_id: UUID) -> Sequence[User]:
         result = await self.db.execute(
-            select(self.model).where(self.model.roles.any(id=role_id))
+            _STMT_LIST.where(self.model.roles.any(id=role_id))
         )
-        users_orm = result.scalars().all()
-        return [self._to_domain(user_orm) for user_orm in users_orm]
+        return [User.from_persisted(*row) for row in result]
 
     async def get_hashed_password_by_email(self, email: str) -> str:
         """
@@ -144,17 +286,35 @@ class UserRepository(IUserRepository):
         """
         from app.domain.exceptions.base import ValidationError
         
-        result = await self.db.execute(
-            select(self.model.hashed_password).where(self.model.email == email)
-        )
-        hashed_password = result.scalar_one_or_none()
+        conn = await self.db.connection()
+        if conn.dialect.driver == "asyncpg":
+            # Ruta caliente del login: ``fetchval`` directo sobre la conexión de
+            # la sesión (misma transacción), sin compilar ni construir Row;
+            # asyncpg reutiliza el prepared statement de su caché por conexión
+            raw = await conn.get_raw_connection()
+            hashed_password = await raw.driver_connection.fetchval(
+                _SQL_HASH_BY_EMAIL, email
+            )
+        else:
+            result = await self.db.execute(_STMT_HASH_BY_EMAIL, {"email": email})
+            hashed_password = result.scalar_one_or_none()
         
         if hashed_password is None:
             raise ValidationError("Credenciales incorrectas")
             
         return hashed_password
 
+    async def update_hashed_password(self, user_id: UUID, hashed_password: str) -> None:
+        """Reemplaza el hash de la contraseña con un único UPDATE."""
+        await self.db.execute(
+            sa_update(self.model)
+            .where(self.model.id == user_id)
+            .values(hashed_password=hashed_password)
+        )
+        await self.db.flush()
+
     async def update_last_login(self, user_id: UUID) -> User:
+        self._cache.clear()
         result = await self.db.execute(
             select(self.model).where(self.model.id == user_id)
         )
@@ -164,50 +324,52 @@ class UserRepository(IUserRepository):
 
         user_orm.updated_at = datetime.now(UTC)
         await self.db.flush()
-        await self.db.refresh(user_orm)
         return self._to_domain(user_orm)
 
-    async def count(self, **filters: str | float | bool | UUID | datetime | date | None) -> int:
-        raise NotImplementedError()
+    async def count(self, **filters: AcceptedQueryTypes) -> int:
+        """Cuenta los usuarios que cumplen los filtros con un COUNT(*)."""
+        query = (
+            select(func.count())
+            .select_from(self.model)
+            .where(*filter_conditions(_FIELD_COLUMNS, self.model.__name__, filters))
+        )
+        return (await self.db.execute(query)).scalar_one()
 
-    async def exists(self, **filters: str | float | bool | UUID | datetime | date | None) -> bool:
-        raise NotImplementedError()
+    async def exists(self, **filters: AcceptedQueryTypes) -> bool:
+        """Indica si hay algún usuario que cumpla los filtros (SELECT EXISTS)."""
+        conditions = filter_conditions(_FIELD_COLUMNS, self.model.__name__, filters)
+        result = await self.db.execute(
+            select(sa_exists(select(self.model.id).where(*conditions)))
+        )
+        return bool(result.scalar_one())
 
     async def update(self, entity: User) -> User:
-        # Implementación de update pendiente, similar a otros repositorios
-        user_orm = await self.db.get(self.model, entity.id)
+        self._cache.clear()
+        # Un único UPDATE ... RETURNING; updated_at lo completa el ``onupdate``
+        # del modelo. La contraseña tiene su propio flujo (update_hashed_password).
+        stmt = (
+            sa_update(self.model)
+            .where(self.model.id == entity.id)
+            .values(
+                email=entity.email,
+                full_name=entity.full_name,
+                is_active=entity.is_active,
+            )
+            .returning(self.model)
+        )
+        user_orm = (await self.db.scalars(stmt)).one_or_none()
         if not user_orm:
             raise EntityNotFoundError(entity="User", entity_id=str(entity.id))
-
-        # Actualizar campos. Asegúrate de que los campos de 'entity' (User de dominio)
-        # se mapeen correctamente a 'user_orm' (UserORM)
-        user_orm.email = entity.email
-        user_orm.full_name = entity.full_name
-        user_orm.is_active = entity.is_active
-        # user_orm.is_superuser = entity.is_superuser # Si es necesario
-        # Si hashed_password se puede actualizar aquí, añádelo.
-        # Normalmente, la actualización de contraseña tiene un flujo dedicado.
-        # user_orm.hashed_password = entity.hashed_password 
-
-        await self.db.flush()
-        await self.db.refresh(user_orm)
         return self._to_domain(user_orm)
 
     async def delete(self, entity_id: UUID) -> None:
-        """Elimina un usuario sin acceder a la relación `roles`.
+        """Elimina un usuario con un único DELETE.
 
-        Evitamos cualquier acceso a ``user_orm.roles`` para no provocar
-        consultas a tablas que pueden no existir en la base de datos de test
-        (por ejemplo, ``roles`` o ``user_roles``). Simplemente eliminamos el
-        usuario y confirmamos la operación.
+        Las asignaciones de ``user_roles`` las borra el ``ON DELETE CASCADE``
+        de la base de datos (``roles`` usa ``passive_deletes``), así que no se
+        carga la relación ni hace falta vaciar el identity map.
         """
-
-        # Elimina la instancia del identity map para que el flush asociado a
-        # commit no intente cargar sus relaciones.
-        self.db.sync_session.expunge_all()
-
-        # Ejecutamos el DELETE SQL directamente.
+        self._cache.clear()
         await self.db.execute(sa_delete(self.model).where(self.model.id == entity_id))
-
-        # Solo flush para aplicar cambios sin cerrar la transacción (importante en tests).
+        # Solo flush: el endpoint confirma con UnitOfWork (importante en tests)
         await self.db.flush()
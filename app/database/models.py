@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +13,15 @@ from app.database.base import Base
 class User(Base):
     """Modelo ORM para usuarios."""
     __tablename__ = "users"
+    __table_args__ = (
+        # Índice cubriente para el login: get_hashed_password_by_email se
+        # resuelve con un index-only scan, sin leer el heap
+        Index(
+            "ix_users_email_hpw",
+            "email",
+            postgresql_include=["hashed_password"],
+        ),
+    )
 
     # id is now inherited from Base
     email: Mapped[str] = mapped_column(
@@ -32,8 +41,10 @@ class User(Base):
         onupdate=lambda: datetime.now(UTC)
     )
 
+    # passive_deletes: las filas de user_roles las borra el ON DELETE CASCADE
+    # de la base de datos, sin cargar la colección al eliminar el usuario
     roles: Mapped[list[Role]] = relationship(
-        "Role", secondary="user_roles", back_populates="users"
+        "Role", secondary="user_roles", back_populates="users", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -51,7 +62,7 @@ class Role(Base):
     )
 
     users: Mapped[list[User]] = relationship(
-        "User", secondary="user_roles", back_populates="roles"
+        "User", secondary="user_roles", back_populates="roles", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -61,10 +72,10 @@ class UserRole(Base):
     """Tabla intermedia para la relación muchos a muchos entre usuarios y roles."""
     __tablename__ = "user_roles"
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
     role_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("roles.id"), primary_key=True
+        UUID(as_uuid=True), ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True
     )
     assigned_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
@@ -73,6 +84,15 @@ class UserRole(Base):
 class Contact(Base):
     """Modelo ORM para contactos."""
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Índice parcial: solo los no leídos, ordenados por fecha (get_unread)
+        Index(
+            "ix_contacts_unread_created_at",
+            "created_at",
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = 0"),
+        ),
+    )
     # id is now inherited from Base
     name: Mapped[str] = mapped_column(String, nullable=False)
     email: Mapped[str] = mapped_column(String, nullable=False)
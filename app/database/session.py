@@ -3,20 +3,75 @@ Gestión centralizada de la sesión de base de datos para SQLAlchemy.
 Incluye creación de engine asíncrono y dependencia para FastAPI.
 """
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
 # URL de la base de datos (debería estar en settings)
 DATABASE_URL = settings.SQLALCHEMY_DATABASE_URI
 
+
+def _asyncpg_connect_args() -> dict[str, Any]:
+    """Argumentos de conexión de asyncpg según haya o no pgbouncer delante.
+
+    Con pgbouncer en modo *transaction pooling* cada transacción puede caer en
+    un backend distinto, así que los prepared statements con nombre fijo
+    chocan (``DuplicatePreparedStatementError``): se desactivan ambas cachés y
+    cada statement recibe un nombre único.
+    """
+    if settings.DB_PGBOUNCER:
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Opciones de pool y del driver para el engine.
+
+    Con asyncpg el pool debe ser ``AsyncAdaptedQueuePool`` (un ``QueuePool``
+    síncrono bloquea el event loop) y lo bastante grande para la concurrencia
+    esperada; con menos conexiones el throughput se estanca en el tamaño del
+    pool. SQLite mantiene el pool por defecto de SQLAlchemy.
+
+    Para asyncpg se amplían además las cachés de prepared statements (la de
+    SQLAlchemy y la del propio driver): las consultas repetidas con el mismo
+    SQL se ejecutan sobre un plan ya preparado en el servidor (salvo detrás
+    de pgbouncer, ver ``_asyncpg_connect_args``).
+    """
+    if url.startswith("sqlite"):
+        return {}
+    options: dict[str, Any] = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+    if "+asyncpg" in url:
+        options["connect_args"] = _asyncpg_connect_args()
+    return options
+
+
 # Engine asíncrono
 engine = create_async_engine(
-    DATABASE_URL, echo=getattr(settings, "DEBUG", False), future=True
+    DATABASE_URL,
+    echo=getattr(settings, "DEBUG", False),
+    future=True,
+    **_engine_options(DATABASE_URL),
 )
 
-# Factory de sesiones asíncronas
+# Factory de sesiones asíncronas (expire_on_commit=False: sin recargar los
+# objetos tras el commit, ya se mapearon a dominio)
 AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
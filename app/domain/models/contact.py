@@ -45,6 +45,33 @@ class Contact(AuditableEntity):
 
         self.validate()
 
+    @classmethod
+    def from_persisted(
+        cls,
+        id: UUID,
+        full_name: str,
+        email: str,
+        message: str,
+        is_read: bool,
+        created_at: datetime,
+        updated_at: datetime | None,
+    ) -> "Contact":
+        """Reconstruye un contacto ya persistido sin volver a validarlo.
+
+        Los datos leídos de la base de datos ya pasaron ``validate()`` al
+        crearse, así que se omite ``__init__`` y se asignan los atributos
+        directamente (ruta rápida para listados grandes).
+        """
+        obj = cls.__new__(cls)
+        obj.id = id
+        obj.full_name = full_name
+        obj.email = email
+        obj.message = message
+        obj.is_read = is_read
+        obj.created_at = created_at
+        obj.updated_at = updated_at or created_at
+        return obj
+
     def update_message(self, new_message: str) -> None:
         if not new_message.strip():
             raise ValueError("El mensaje no puede estar vacío")
@@ -50,6 +50,33 @@ class ContactRequest(AuditableEntity):
 
         self.validate()
 
+    @classmethod
+    def from_persisted(
+        cls,
+        id: UUID,
+        full_name: str,
+        email: str,
+        phone: str | None,
+        message: str,
+        created_at: datetime,
+        updated_at: datetime | None,
+    ) -> ContactRequest:
+        """Reconstruye una solicitud ya persistida sin volver a validarla.
+
+        Igual que ``Contact.from_persisted``: se omite ``__init__`` (la
+        validación es para la entrada del usuario) y se asignan los atributos
+        directamente, sin generar id ni marcas de tiempo.
+        """
+        obj = cls.__new__(cls)
+        obj.id = id
+        obj.created_at = created_at
+        obj.updated_at = updated_at or created_at
+        obj.full_name = full_name
+        obj.email = email
+        obj.phone = phone
+        obj.message = message
+        return obj
+
     # ---------------------------------------------------------------------
     # Validaciones
     # ---------------------------------------------------------------------
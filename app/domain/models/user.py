@@ -49,6 +49,34 @@ class User(AuditableEntity):
         self.role_ids = role_ids or set()
         self.hashed_password = hashed_password
 
+    @classmethod
+    def from_persisted(
+        cls,
+        id: UUID,
+        email: str,
+        full_name: str,
+        is_active: bool,
+        is_superuser: bool,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ) -> "User":
+        """Reconstruye un usuario ya persistido sin volver a validarlo.
+
+        Igual que ``Contact.from_persisted``: se omite ``__init__`` y se
+        asignan los slots directamente (ruta rápida para listados grandes).
+        """
+        obj = cls.__new__(cls)
+        obj.id = id
+        obj.email = email
+        obj.full_name = full_name
+        obj.is_active = is_active
+        obj.is_superuser = is_superuser
+        obj.role_ids = set()
+        obj.hashed_password = None
+        obj.created_at = created_at or datetime.now(UTC)
+        obj.updated_at = updated_at or obj.created_at
+        return obj
+
     def assign_role(self, role_id: UUID) -> None:
         self.role_ids.add(role_id)
 
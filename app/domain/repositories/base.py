@@ -10,7 +10,7 @@ concretos, siguiendo el patrón Repository y el principio de inversión de
 dependencias (DIP) de SOLID.
 """
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import date, datetime
 from typing import Generic, TypeVar
 from uuid import UUID
@@ -229,6 +229,75 @@ class IUserRepository(IRepository[User], ABC): # Renombrado y hereda de IReposit
         """
         ...
 
+    @abstractmethod
+    async def list(
+        self, *, limit: int = 100, after_id: UUID | None = None
+    ) -> Sequence[User]:
+        """
+        Lista una página de usuarios ordenada por id.
+
+        Args:
+            limit: Número máximo de usuarios (la implementación lo acota)
+            after_id: Cursor keyset: id del último usuario de la página anterior
+
+        Returns:
+            Sequence[User]: Página de usuarios
+        """
+        ...
+
+    @abstractmethod
+    async def filter_by(
+        self,
+        *,
+        limit: int = 100,
+        after_id: UUID | None = None,
+        **filters: str | float | bool | UUID | datetime | date | None,
+    ) -> Sequence[User]:
+        """
+        Filtra usuarios por campo=valor, paginando por keyset.
+
+        Args:
+            limit: Número máximo de usuarios (la implementación lo acota)
+            after_id: Cursor keyset: id del último usuario de la página anterior
+            **filters: Criterios de filtrado como pares campo=valor
+
+        Returns:
+            Sequence[User]: Página de usuarios que cumplen los criterios
+
+        Raises:
+            ValueError: Si alguno de los campos de filtro no existe
+        """
+        ...
+
+    @abstractmethod
+    def iter_all(self) -> AsyncIterator[User]:
+        """
+        Recorre todos los usuarios sin materializarlos en memoria.
+
+        Returns:
+            AsyncIterator[User]: Usuarios entregados uno a uno
+        """
+        ...
+
+    @abstractmethod
+    async def bulk_create(
+        self, entities: Sequence[User], hashed_passwords: Sequence[str]
+    ) -> Sequence[User]:
+        """
+        Crea varios usuarios en una sola operación.
+
+        Args:
+            entities: Usuarios a crear
+            hashed_passwords: Hash de la contraseña de cada usuario, en el mismo orden
+
+        Returns:
+            Sequence[User]: Los usuarios creados, en el mismo orden
+
+        Raises:
+            ValueError: Si no hay un hash por cada usuario
+        """
+        ...
+
     @abstractmethod
     async def get_active(self) -> Sequence[User]:
         """
@@ -269,6 +338,19 @@ class IUserRepository(IRepository[User], ABC): # Renombrado y hereda de IReposit
         """
         ...
 
+    @abstractmethod
+    async def update_hashed_password(self, user_id: UUID, hashed_password: str) -> None:
+        """
+        Reemplaza el hashed_password de un usuario.
+
+        Se usa para regenerar hashes creados con parámetros antiguos.
+
+        Args:
+            user_id: UUID del usuario
+            hashed_password: Nuevo hash de la contraseña
+        """
+        ...
+
     @abstractmethod
     async def update_last_login(self, user_id: UUID) -> User:
         """
@@ -315,6 +397,69 @@ class IRoleRepository(IRepository[Role], ABC): # Renombrado y hereda de IReposit
         """
         ...
 
+    @abstractmethod
+    async def list(
+        self, *, limit: int = 100, after_id: UUID | None = None
+    ) -> Sequence[Role]:
+        """
+        Lista una página de roles ordenada por id.
+
+        Args:
+            limit: Número máximo de roles (la implementación lo acota)
+            after_id: Cursor keyset: id del último rol de la página anterior
+
+        Returns:
+            Sequence[Role]: Página de roles
+        """
+        ...
+
+    @abstractmethod
+    async def filter_by(
+        self,
+        *,
+        limit: int = 100,
+        after_id: UUID | None = None,
+        **filters: str | float | bool | UUID | datetime | date | None,
+    ) -> Sequence[Role]:
+        """
+        Filtra roles por campo=valor, paginando por keyset.
+
+        Args:
+            limit: Número máximo de roles (la implementación lo acota)
+            after_id: Cursor keyset: id del último rol de la página anterior
+            **filters: Criterios de filtrado como pares campo=valor
+
+        Returns:
+            Sequence[Role]: Página de roles que cumplen los criterios
+
+        Raises:
+            ValueError: Si alguno de los campos de filtro no existe
+        """
+        ...
+
+    @abstractmethod
+    def iter_all(self) -> AsyncIterator[Role]:
+        """
+        Recorre todos los roles sin materializarlos en memoria.
+
+        Returns:
+            AsyncIterator[Role]: Roles entregados uno a uno
+        """
+        ...
+
+    @abstractmethod
+    async def bulk_create(self, entities: Sequence[Role]) -> Sequence[Role]:
+        """
+        Crea varios roles en una sola operación.
+
+        Args:
+            entities: Roles a crear
+
+        Returns:
+            Sequence[Role]: Los roles creados, en el mismo orden
+        """
+        ...
+
     @abstractmethod
     async def get_default_roles(self) -> Sequence[Role]:
         """
@@ -372,10 +517,33 @@ class IContactRepository(IRepository[Contact], ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_all(self) -> AsyncIterator[Contact]:
+        """
+        Recorre todos los contactos sin materializarlos en memoria.
+
+        Returns:
+            AsyncIterator[Contact]: Contactos entregados uno a uno
+        """
+        ...
+
+    @abstractmethod
+    async def bulk_create(self, entities: Sequence[Contact]) -> Sequence[Contact]:
+        """
+        Crea varios contactos en una sola operación.
+
+        Args:
+            entities: Contactos a crear
+
+        Returns:
+            Sequence[Contact]: Los contactos creados, en el mismo orden
+        """
+        ...
+
     @abstractmethod
     async def get_unread(self) -> Sequence[Contact]:
         """
-        Obtiene todos los contactos no leídos.
+        Obtiene todos los contactos no leídos, del más reciente al más antiguo.
 
         Returns:
             Sequence[Contact]: Secuencia de contactos no leídos
@@ -399,6 +567,19 @@ class IContactRepository(IRepository[Contact], ABC):
         """
         ...
 
+    @abstractmethod
+    async def mark_many_as_read(self, contact_ids: Iterable[UUID]) -> int:
+        """
+        Marca varios contactos como leídos en una sola operación.
+
+        Args:
+            contact_ids: IDs de los contactos a marcar
+
+        Returns:
+            int: Número de contactos que no estaban leídos y se actualizaron
+        """
+        ...
+
     @abstractmethod
     async def get_by_date_range(
         self, start_date: datetime, end_date: datetime
@@ -16,6 +16,16 @@ class IContactRequestRepository(ABC):
     async def create(self, contact_request: ContactRequest) -> ContactRequest:  # noqa: D401
         """Persistir y devolver la solicitud almacenada."""
 
+    @abstractmethod
+    async def bulk_create(
+        self, contact_requests: Sequence[ContactRequest]
+    ) -> Sequence[ContactRequest]:  # noqa: D401
+        """Persistir varias solicitudes de una vez (un único round-trip)."""
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Sequence[ContactRequest]:  # noqa: D401
+        """Solicitudes enviadas desde un email concreto."""
+
     @abstractmethod
     async def list(self) -> Sequence[ContactRequest]:  # noqa: D401
         """Listar todas las solicitudes (útil para tests o administración)."""
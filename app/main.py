@@ -1,9 +1,10 @@
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
-from app.api.v1.api import api_router
+from app.api.v1.api import create_api_router
 from app.core.config import settings
 from app.core.events import shutdown_event, startup_event
+from app.core.exception_handlers import setup_exception_handlers
 from app.infrastructure.adapters.http.fastapi_middleware import setup_middlewares
 from app.infrastructure.adapters.logging.standard_logger import logger_factory
 
@@ -16,7 +17,9 @@ def create_app() -> FastAPI:
     """
     # Inicializar el sistema de logging
     logger = logger_factory.get_logger("app.main")
-    logger.info(f"Iniciando aplicación en modo {'DEBUG' if settings.DEBUG else 'PRODUCCIÓN'}")
+    logger.info(
+        "Iniciando aplicación en modo %s", "DEBUG" if settings.DEBUG else "PRODUCCIÓN"
+    )
     
     app = FastAPI(
         title=settings.PROJECT_NAME,
@@ -40,9 +43,15 @@ def create_app() -> FastAPI:
     setup_middlewares(app)
     logger.debug("Middlewares configurados correctamente")
 
+    # Mapeo único de excepciones de dominio a códigos HTTP
+    setup_exception_handlers(app)
+
     # Incluir router de la API v1
-    app.include_router(api_router, prefix=settings.API_V1_STR)
-    logger.debug(f"Router API v1 configurado en {settings.API_V1_STR}")
+    app.include_router(
+        create_api_router(disabled=settings.DISABLED_ROUTERS),
+        prefix=settings.API_V1_STR,
+    )
+    logger.debug("Router API v1 configurado en %s", settings.API_V1_STR)
     
     # Registrar manejadores de eventos
     app.add_event_handler("startup", startup_event)
@@ -2,13 +2,15 @@ from datetime import datetime
 from uuid import UUID
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from datetime import timezone
 
+from app.schemas.types import EmailAddress
+
 
 class ContactBase(BaseModel):
     full_name: str
-    email: EmailStr
+    email: EmailAddress
     message: str
     is_read: bool = False
 
@@ -38,7 +40,7 @@ class ContactResponse(ContactBase):
 
 class ContactUpdate(ContactBase):
     full_name: str | None = None
-    email: EmailStr | None = None
+    email: EmailAddress | None = None
     message: str | None = None
     is_read: bool | None = None
 
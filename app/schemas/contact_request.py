@@ -3,16 +3,24 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import Optional
+from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer
 from pydantic import ConfigDict
 
+from app.schemas.types import EmailAddress
+
 
 class ContactRequestCreate(BaseModel):
     """Datos entrantes desde el formulario del frontend."""
 
+    # DTO de solo lectura: el servicio solo lo lee
+    model_config = ConfigDict(frozen=True)
+
     full_name: str = Field(..., max_length=150, json_schema_extra={"examples": ["Juan Pérez"]})
-    email: EmailStr = Field(..., json_schema_extra={"examples": ["juan@example.com"]})
+    email: EmailAddress = Field(
+        ..., json_schema_extra={"examples": ["juan@example.com"]}
+    )
     phone: str | None = Field(None, max_length=30, json_schema_extra={"examples": ["+54 11 5555-5555"]})
     message: str = Field(..., max_length=1000, json_schema_extra={"examples": ["Hola, tengo una consulta..."]})
 
@@ -26,9 +34,9 @@ class ContactRequestResponse(BaseModel):
         }
     )
     
-    id: str
+    id: UUID
     full_name: str
-    email: EmailStr
+    email: EmailAddress
     message: str
     created_at: datetime
     updated_at: datetime | None = None
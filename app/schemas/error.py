@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ErrorResponse(BaseModel):
+    """Cuerpo de las respuestas de error (``{"detail": "..."}``)."""
+
+    detail: str
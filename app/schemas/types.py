@@ -0,0 +1,26 @@
+"""Tipos anotados compartidos por los esquemas Pydantic."""
+from functools import lru_cache
+from typing import Annotated
+
+from email_validator import validate_email
+from pydantic import AfterValidator
+from pydantic.json_schema import WithJsonSchema
+
+
+@lru_cache(maxsize=10_000)
+def normalize_email(value: str) -> str:
+    """Valida un email y devuelve su forma normalizada.
+
+    Sustituye a ``EmailStr`` en los esquemas de entrada: la validación se hace
+    con ``email-validator`` sin comprobar DNS y el resultado se cachea, ya que
+    los mismos usuarios se autentican y envían formularios repetidamente.
+    Lanza ``EmailNotValidError`` (subclase de ``ValueError``) si no es válido.
+    """
+    return validate_email(value, check_deliverability=False).normalized
+
+
+EmailAddress = Annotated[
+    str,
+    AfterValidator(normalize_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
@@ -2,11 +2,13 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, field_serializer
+from pydantic import BaseModel, ConfigDict, field_serializer
+
+from app.schemas.types import EmailAddress
 
 
 class UserCreate(BaseModel):
-    email: EmailStr
+    email: EmailAddress
     password: str
     full_name: str
 
@@ -18,7 +20,7 @@ class UserResponse(BaseModel):
         }
     )
     id: UUID
-    email: EmailStr
+    email: EmailAddress
     full_name: str | None = None
     is_active: bool = True
     created_at: datetime
@@ -39,7 +41,7 @@ class UserUpdate(BaseModel):
     
     Todos los campos son opcionales para permitir actualizaciones parciales.
     """
-    email: EmailStr | None = None
+    email: EmailAddress | None = None
     full_name: str | None = None
     password: str | None = None
     is_active: bool | None = None
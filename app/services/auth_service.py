@@ -1,5 +1,8 @@
-
-from app.core.security.hashing import verify_password
+from app.core.security.hashing import (
+    aget_password_hash,
+    averify_password,
+    password_needs_rehash,
+)
 from app.core.security.jwt import create_access_token
 from app.domain.exceptions.base import ValidationError
 from app.domain.models.user import User
@@ -14,12 +17,20 @@ class AuthService:
         user = await self.user_repository.get_by_email(email)
         if not user:
             raise ValidationError("Credenciales incorrectas")
-        
+
         hashed_password = await self.user_repository.get_hashed_password_by_email(email)
-        if not hashed_password or not verify_password(password, hashed_password):
+        if not hashed_password or not await averify_password(password, hashed_password):
             raise ValidationError("Credenciales incorrectas")
+
+        # Migración perezosa de hashes generados con parámetros antiguos
+        if password_needs_rehash(hashed_password):
+            await self.user_repository.update_hashed_password(
+                user.id, await aget_password_hash(password)
+            )
         return user
 
     def generate_token(self, user: User) -> dict[str, str]:
-        access_token = create_access_token({"sub": str(user.id)})
+        # Se firma en cada login: HS256 cuesta microsegundos y cada cliente
+        # recibe un token propio con la vigencia completa
+        access_token = create_access_token(sub=str(user.id))
         return {"access_token": access_token, "token_type": "bearer"}
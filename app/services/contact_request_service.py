@@ -61,7 +61,7 @@ class ContactRequestService:  # noqa: D101
 
         await asyncio.gather(
             self._sender.send_email(
-                to=str(settings.FIRST_SUPERUSER),
+                to=settings.FIRST_SUPERUSER,
                 subject="Nueva solicitud de contacto",
                 html_body=admin_html,
             ),
@@ -4,7 +4,7 @@ Servicio para la gestión de contactos.
 Contiene la lógica de negocio relacionada con contactos, separada del acceso a datos
 y de la presentación (API).
 """
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 from app.domain.exceptions.base import EntityNotFoundError
@@ -68,7 +68,8 @@ class ContactService:
             ]
         else:
             contacts = list(await self.contact_repository.list())
-        return [ContactResponse(
+        # Datos confiables de la capa de dominio: se omite la revalidación
+        return [ContactResponse.model_construct(
             id=c.id,
             full_name=c.full_name,
             email=c.email,
@@ -78,6 +79,15 @@ class ContactService:
             updated_at=c.updated_at
         ) for c in contacts]
     
+    def iter_contacts(self) -> AsyncIterator[Contact]:
+        """
+        Recorre todos los contactos en streaming (para exportaciones).
+
+        Returns:
+            AsyncIterator[Contact]: Contactos entregados uno a uno
+        """
+        return self.contact_repository.iter_all()
+
     async def get_contacts_by_email(self, email: str) -> Sequence[Contact]:
         """
         Obtiene contactos por email.
@@ -46,7 +46,7 @@ class EmailService:
             message=contact.message,
         )
         await self._sender.send_email(
-            to=str(settings.FIRST_SUPERUSER),
+            to=settings.FIRST_SUPERUSER,
             subject=subject,
             html_body=html_body,
         )
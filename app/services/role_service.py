@@ -6,6 +6,7 @@ y de la presentación (API).
 """
 from uuid import UUID
 
+from app.crud.base import DEFAULT_PAGE_SIZE
 from app.domain.exceptions.base import EntityNotFoundError, ValidationError
 from app.domain.models.role import Role
 from app.domain.repositories.base import IRoleRepository
@@ -50,18 +51,28 @@ class RoleService:
         """
         return await self.role_repository.get_by_name(name)
     
-    async def list_roles(self, name: str | None = None) -> list[RoleResponse]:
+    async def list_roles(
+        self,
+        name: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after_id: UUID | None = None,
+    ) -> list[RoleResponse]:
         """
-        Devuelve una lista de RoleResponse (schema).
+        Devuelve una página de RoleResponse (schema).
         
-        Con filtro opcional por nombre exacto.
+        Con filtro opcional por nombre exacto, aplicado en la consulta.
+        Paginación por keyset: ``after_id`` es el id del último rol recibido.
         """
         from app.schemas.role import RoleResponse
-        roles = await self.role_repository.list()
-        if name is not None:
-            roles = [r for r in roles if r.name == name]
+        if name is None:
+            roles = await self.role_repository.list(limit=limit, after_id=after_id)
+        else:
+            roles = await self.role_repository.filter_by(
+                limit=limit, after_id=after_id, name=name
+            )
+        # Datos confiables de la capa de dominio: se omite la revalidación
         return [
-            RoleResponse(
+            RoleResponse.model_construct(
                 id=r.id, 
                 name=r.name, 
                 description=r.description,
@@ -4,10 +4,13 @@ Servicio para la gestión de usuarios.
 Contiene la lógica de negocio relacionada con usuarios, separada del acceso a datos
 y de la presentación (API).
 """
+import asyncio
 from collections.abc import Sequence
 from typing import Any, Protocol
 from uuid import UUID
 
+from app.core.security.hashing import hash_pool
+from app.crud.base import DEFAULT_PAGE_SIZE
 from app.domain.exceptions.base import EntityNotFoundError, ValidationError
 from app.domain.models.user import User
 from app.domain.repositories.base import IUserRepository
@@ -77,19 +80,27 @@ class UserService:
     async def get_users(
         self, 
         email: str | None = None, 
-        is_active: bool | None = None
+        is_active: bool | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after_id: UUID | None = None,
     ) -> Sequence[User]:
         """
-        Obtiene la lista de usuarios, con filtros opcionales por email e is_active.
+        Obtiene una página de usuarios, con filtros opcionales por email e is_active.
+
+        Los filtros se aplican en la consulta (no sobre la página ya leída) y la
+        paginación es por keyset: ``after_id`` es el id del último usuario de
+        la página anterior.
         """
-        users = await self.user_repository.list()
-        if email is not None and is_active is not None:
-            return [u for u in users if u.email == email and u.is_active == is_active]
-        elif email is not None:
-            return [u for u in users if u.email == email]
-        elif is_active is not None:
-            return [u for u in users if u.is_active == is_active]
-        return users
+        filters: dict[str, str | bool] = {}
+        if email is not None:
+            filters["email"] = email
+        if is_active is not None:
+            filters["is_active"] = is_active
+        if not filters:
+            return await self.user_repository.list(limit=limit, after_id=after_id)
+        return await self.user_repository.filter_by(
+            limit=limit, after_id=after_id, **filters
+        )
     
     async def get_active_users(self) -> Sequence[User]:
         """
@@ -119,7 +130,10 @@ class UserService:
         # self.hasher.hash_password(user_in.password)
         if not self.hasher:
             raise ValueError("PasswordHasher no está configurado en UserService.")
-        hashed_password = self.hasher.get_password_hash(user_in.password)
+        # Argon2 es costoso en CPU: se ejecuta en el pool de hashing, no en el loop
+        hashed_password = await asyncio.get_running_loop().run_in_executor(
+            hash_pool, self.hasher.get_password_hash, user_in.password
+        )
 
         user_domain = User(
             email=user_in.email,
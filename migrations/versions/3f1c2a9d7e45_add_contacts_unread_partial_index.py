@@ -0,0 +1,33 @@
+"""Add partial index for unread contacts
+
+Revision ID: 3f1c2a9d7e45
+Revises: b0ef349d86e1
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7e45'
+down_revision: Union[str, None] = 'b0ef349d86e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_unread_created_at',
+        'contacts',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text('is_read = false'),
+        sqlite_where=sa.text('is_read = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_unread_created_at', table_name='contacts')
@@ -0,0 +1,39 @@
+"""Add covering index on users.email including hashed_password
+
+Revision ID: 7a2d4c91b5e3
+Revises: 3f1c2a9d7e45
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2d4c91b5e3'
+down_revision: Union[str, None] = '3f1c2a9d7e45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY no puede ejecutarse dentro de una transacción
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_hpw',
+            'users',
+            ['email'],
+            unique=False,
+            postgresql_include=['hashed_password'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_email_hpw',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""Cascade deletes from users and roles to user_roles
+
+Revision ID: c5e8f1a3d204
+Revises: 7a2d4c91b5e3
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8f1a3d204'
+down_revision: Union[str, None] = '7a2d4c91b5e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Nombres por defecto de PostgreSQL para las FK de user_roles
+_FOREIGN_KEYS = (
+    ('user_roles_user_id_fkey', 'users', 'user_id'),
+    ('user_roles_role_id_fkey', 'roles', 'role_id'),
+)
+
+
+def _recreate_foreign_keys(ondelete: str | None) -> None:
+    for name, referent, column in _FOREIGN_KEYS:
+        op.drop_constraint(name, 'user_roles', type_='foreignkey')
+        op.create_foreign_key(
+            name, 'user_roles', referent, [column], ['id'], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    _recreate_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    _recreate_foreign_keys(None)
@@ -101,7 +101,7 @@ async def test_access_protected_route_expired_token(test_app: AsyncClient, creat
     from datetime import timedelta
 
     expired_token = create_access_token(
-        {"sub": create_test_user_for_auth["user_id"]},
+        create_test_user_for_auth["user_id"],
         expires_delta=timedelta(seconds=-1)  # Token expirado
     )
     
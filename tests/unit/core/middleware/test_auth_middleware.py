@@ -0,0 +1,84 @@
+import pytest
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from app.core.middleware import auth_middleware
+from app.core.middleware.auth_middleware import AuthMiddleware
+
+
+def _scope(authorization: str | None, path: str = "/api/v1/users/me") -> dict[str, Any]:
+    headers = []
+    if authorization is not None:
+        headers.append((b"authorization", authorization.encode("latin-1")))
+    return {"type": "http", "method": "GET", "path": path, "headers": headers}
+
+
+async def _run(scope: dict[str, Any]) -> tuple[AsyncMock, list[dict[str, Any]]]:
+    app = AsyncMock()
+    messages: list[dict[str, Any]] = []
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    await AuthMiddleware(app)(scope, AsyncMock(), send)
+    return app, messages
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "authorization",
+    [None, "", "   ", "Bearer", "Bearer   ", "Basic abc", "Token abc"],
+)
+async def test_rejects_missing_or_malformed_header(authorization: str | None):
+    app, messages = await _run(_scope(authorization))
+    assert messages[0]["status"] == 401
+    assert (b"www-authenticate", b"Bearer") in messages[0]["headers"]
+    assert messages[1]["body"] == b'{"detail":"No autenticado"}'
+    app.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rejects_invalid_token():
+    with patch.object(auth_middleware, "decode_access_token_cached", return_value=None):
+        app, messages = await _run(_scope("Bearer bad.token"))
+    assert messages[0]["status"] == 401
+    assert messages[1]["body"] == b'{"detail":"Could not validate credentials"}'
+    app.assert_not_awaited()
+
+
+def test_401_factories_return_fresh_responses():
+    first = auth_middleware._unauth()
+    first.headers["X-Request-ID"] = "abc"
+    assert auth_middleware._unauth() is not first
+    assert "x-request-id" not in auth_middleware._unauth().headers
+    assert auth_middleware._invalid_creds() is not auth_middleware._invalid_creds()
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_shared_through_scope_state():
+    scope = _scope("bearer  good.token ")
+    payload = {"sub": "user-id"}
+    with patch.object(
+        auth_middleware, "decode_access_token_cached", return_value=payload
+    ) as decode:
+        app, messages = await _run(scope)
+    decode.assert_called_once_with("good.token")
+    app.assert_awaited_once()
+    assert not messages
+    assert scope["state"]["jwt_token"] == "good.token"
+    assert scope["state"]["jwt_payload"] is payload
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/v1/auth/login", "/health"])
+async def test_public_and_non_api_paths_skip_authentication(path: str):
+    app, messages = await _run(_scope(None, path=path))
+    app.assert_awaited_once()
+    assert not messages
+
+
+@pytest.mark.asyncio
+async def test_non_http_scopes_pass_through():
+    app, messages = await _run({"type": "lifespan"})
+    app.assert_awaited_once()
+    assert not messages
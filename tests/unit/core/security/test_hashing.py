@@ -1,5 +1,14 @@
 import pytest
-from app.core.security.hashing import verify_password, get_password_hash
+from argon2 import PasswordHasher as Argon2Hasher
+
+from app.core.security.hashing import (
+    aget_password_hash,
+    averify_password,
+    default_password_hasher,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 
 def test_get_password_hash():
     password = "test_password"
@@ -26,3 +35,30 @@ def test_verify_password_with_different_hash():
     another_hashed_password = get_password_hash(another_password)
     assert verify_password(password, another_hashed_password) is False
 
+
+def test_verify_password_invalid_hash():
+    assert verify_password("test_password", "not-a-valid-hash") is False
+
+def test_password_hash_uses_owasp_argon2id_profile():
+    hashed = get_password_hash("secret")
+    assert hashed.startswith("$argon2id$v=19$m=19456,t=2,p=1$")
+
+def test_password_needs_rehash_current_params():
+    hashed_password = get_password_hash("test_password")
+    assert password_needs_rehash(hashed_password) is False
+
+def test_password_needs_rehash_legacy_params():
+    # Hash generado con los parámetros por defecto de passlib (m=65536, t=3, p=4)
+    legacy_hasher = Argon2Hasher(time_cost=3, memory_cost=65536, parallelism=4)
+    legacy_hash = legacy_hasher.hash("test_password")
+    assert verify_password("test_password", legacy_hash) is True
+    assert password_needs_rehash(legacy_hash) is True
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify():
+    hashed_password = await aget_password_hash("test_password")
+    assert await averify_password("test_password", hashed_password) is True
+    assert await averify_password("wrong_password", hashed_password) is False
+
+def test_hasher_has_no_instance_dict():
+    assert not hasattr(default_password_hasher, "__dict__")
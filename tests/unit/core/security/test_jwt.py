@@ -1,8 +1,17 @@
 import pytest
 from datetime import UTC, datetime, timedelta
-from app.core.security.jwt import create_access_token, decode_access_token, ALGORITHM
+from unittest.mock import patch
+
+from app.core.security import jwt as jwt_module
+from app.core.security.jwt import (
+    ALGORITHM,
+    create_access_token,
+    decode_access_token,
+    decode_access_token_cached,
+    hmac_uses_openssl,
+)
 from app.core.config import settings
-from jose import jwt
+import jwt
 
 # Mock settings for testing purposes if needed, though direct import is fine for unit tests
 # settings.SECRET_KEY = "supersecretkey"
@@ -10,7 +19,7 @@ from jose import jwt
 
 def test_create_access_token_default_expiry():
     data = {"sub": "test@example.com", "user_id": "123"}
-    token = create_access_token(data)
+    token = create_access_token(data["sub"], extra={"user_id": data["user_id"]})
     assert isinstance(token, str)
     assert len(token) > 0
 
@@ -27,7 +36,7 @@ def test_create_access_token_default_expiry():
 def test_create_access_token_custom_expiry():
     data = {"sub": "custom@example.com"}
     custom_delta = timedelta(minutes=5)
-    token = create_access_token(data, expires_delta=custom_delta)
+    token = create_access_token(data["sub"], expires_delta=custom_delta)
 
     decoded_data = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
     assert decoded_data["sub"] == data["sub"]
@@ -36,19 +45,22 @@ def test_create_access_token_custom_expiry():
     assert decoded_data["exp"] <= int(expected_expiry.timestamp() + 60)
     assert decoded_data["exp"] >= int(expected_expiry.timestamp() - 60)
 
-def test_create_access_token_missing_sub():
-    data = {"user_id": "123"} # Missing 'sub'
-    with pytest.raises(ValueError, match="El token debe incluir un 'sub' válido como string no vacío"):
-        create_access_token(data)
+def test_create_access_token_extra_cannot_override_sub_or_exp():
+    token = create_access_token(
+        "owner@example.com", extra={"sub": "other", "exp": 0, "role": "admin"}
+    )
+    decoded_data = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    assert decoded_data["sub"] == "owner@example.com"
+    assert decoded_data["exp"] > 0
+    assert decoded_data["role"] == "admin"
 
 def test_create_access_token_empty_sub():
-    data = {"sub": "", "user_id": "123"} # Empty 'sub'
     with pytest.raises(ValueError, match="El token debe incluir un 'sub' válido como string no vacío"):
-        create_access_token(data)
+        create_access_token("", extra={"user_id": "123"})
 
 def test_decode_access_token_valid():
     data = {"sub": "decode@example.com"}
-    token = create_access_token(data, expires_delta=timedelta(minutes=1))
+    token = create_access_token(data["sub"], expires_delta=timedelta(minutes=1))
     decoded_data = decode_access_token(token)
     assert decoded_data is not None
     assert decoded_data["sub"] == data["sub"]
@@ -56,7 +68,7 @@ def test_decode_access_token_valid():
 def test_decode_access_token_expired():
     data = {"sub": "expired@example.com"}
     # Create a token that expires immediately
-    token = create_access_token(data, expires_delta=timedelta(seconds=-1))
+    token = create_access_token(data["sub"], expires_delta=timedelta(seconds=-1))
     # Wait a moment to ensure it's expired
     import time
     time.sleep(1)
@@ -65,7 +77,7 @@ def test_decode_access_token_expired():
 
 def test_decode_access_token_invalid_signature():
     data = {"sub": "invalid@example.com"}
-    token = create_access_token(data)
+    token = create_access_token(data["sub"])
     # Tamper with the token to invalidate signature
     tampered_token = token + "abc"
     decoded_data = decode_access_token(tampered_token)
@@ -75,7 +87,7 @@ def test_decode_access_token_wrong_secret_key():
     original_secret_key = settings.SECRET_KEY
     settings.SECRET_KEY = "wrongsecretkey"
     data = {"sub": "wrongkey@example.com"}
-    token = create_access_token(data, expires_delta=timedelta(minutes=1))
+    token = create_access_token(data["sub"], expires_delta=timedelta(minutes=1))
     settings.SECRET_KEY = original_secret_key # Restore original key
     decoded_data = decode_access_token(token)
     assert decoded_data is None
@@ -85,3 +97,43 @@ def test_decode_access_token_wrong_algorithm():
     token = jwt.encode(data, settings.SECRET_KEY, algorithm="HS512") # Encode with a different algorithm than ALGORITHM (which is HS256)
     decoded_data = decode_access_token(token)
     assert decoded_data is None
+
+def test_decode_access_token_cached_reuses_payload():
+    jwt_module._decoded_token_cache.clear()
+    token = create_access_token(
+        "cached@example.com", expires_delta=timedelta(minutes=1)
+    )
+    with patch.object(
+        jwt_module, "decode_access_token", wraps=decode_access_token
+    ) as spy:
+        first = decode_access_token_cached(token)
+        second = decode_access_token_cached(token)
+    assert first is not None and first == second
+    assert spy.call_count == 1
+
+def test_decode_access_token_cached_skips_tokens_close_to_expiry():
+    jwt_module._decoded_token_cache.clear()
+    token = create_access_token("soon@example.com", expires_delta=timedelta(seconds=3))
+    assert decode_access_token_cached(token) is not None
+    assert token not in jwt_module._decoded_token_cache
+
+def test_decode_access_token_cached_invalid_token():
+    jwt_module._decoded_token_cache.clear()
+    assert decode_access_token_cached("not-a-token") is None
+    assert not jwt_module._decoded_token_cache
+
+def test_decode_access_token_cached_invalidated_on_secret_rotation():
+    jwt_module._decoded_token_cache.clear()
+    token = create_access_token(
+        "rotate@example.com", expires_delta=timedelta(minutes=1)
+    )
+    assert decode_access_token_cached(token) is not None
+    original_secret_key = settings.SECRET_KEY
+    settings.SECRET_KEY = "rotated-secret-key-with-at-least-32-chars"
+    try:
+        assert decode_access_token_cached(token) is None
+    finally:
+        settings.SECRET_KEY = original_secret_key
+
+def test_hmac_uses_openssl():
+    assert hmac_uses_openssl() is True
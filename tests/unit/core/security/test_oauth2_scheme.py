@@ -0,0 +1,43 @@
+import gc
+
+import pytest
+
+from app.core import deps
+from app.core import security
+from app.core.security import oauth2_scheme as oauth2_scheme_module
+from app.core.security.oauth2_scheme import CustomOAuth2PasswordBearer, bearer_token
+
+
+def test_single_oauth2_scheme_instance():
+    # Todo el código debe compartir el mismo esquema (uno solo en OpenAPI)
+    assert security.oauth2_scheme is oauth2_scheme_module.oauth2_scheme
+    assert deps.oauth2_scheme is security.oauth2_scheme
+    instances = [
+        obj for obj in gc.get_objects() if isinstance(obj, CustomOAuth2PasswordBearer)
+    ]
+    assert len(instances) == 1
+
+
+def test_oauth2_scheme_points_to_login_endpoint():
+    assert security.oauth2_scheme.model.flows.password.tokenUrl == "/api/v1/auth/login"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (b"Bearer abc.def", "abc.def"),
+        (b"bEaReR   abc.def  ", "abc.def"),
+        (b"Bearer", None),
+        (b"Bearer   ", None),
+        (b"Basic abc", None),
+        (b"BearerX abc", None),
+        (b"", None),
+    ],
+)
+def test_bearer_token_parsing(header: bytes, expected: str | None):
+    scope = {"headers": [(b"accept", b"*/*"), (b"authorization", header)]}
+    assert bearer_token(scope) == expected
+
+
+def test_bearer_token_missing_header():
+    assert bearer_token({"headers": []}) is None
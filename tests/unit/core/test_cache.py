@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_returns_value_before_expiry():
+    cache: TTLCache[bytes] = TTLCache(ttl=30.0)
+    cache.set(("a", None), b"[]")
+    assert cache.get(("a", None)) == b"[]"
+
+def test_ttl_cache_expires_entries():
+    cache: TTLCache[bytes] = TTLCache(ttl=30.0)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("roles", b"[]")
+    with patch("app.core.cache.time.monotonic", return_value=131.0):
+        assert cache.get("roles") is None
+    assert len(cache) == 0
+
+def test_ttl_cache_clears_when_full():
+    cache: TTLCache[int] = TTLCache(ttl=30.0, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+
+def test_ttl_cache_pop_invalidates_single_entry():
+    cache: TTLCache[int] = TTLCache(ttl=30.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
@@ -0,0 +1,56 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.core.exception_handlers import domain_exception_handler
+from app.domain.exceptions.base import (
+    DomainError,
+    EntityNotFoundError,
+    StructuralValidationError,
+    UnauthorizedOperationError,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("exc", "expected_status"),
+    [
+        (EntityNotFoundError(entity="Rol", entity_id=uuid4()), 404),
+        (StructuralValidationError("Datos inválidos"), 400),
+        (UnauthorizedOperationError("borrar"), 403),
+        (DomainError("Error genérico"), 400),
+    ],
+)
+async def test_domain_exception_handler_maps_status(
+    exc: DomainError, expected_status: int
+) -> None:
+    response = await domain_exception_handler(None, exc)  # type: ignore[arg-type]
+    assert response.status_code == expected_status
+    assert json.loads(response.body) == {"detail": exc.message}
+
+
+@pytest.mark.asyncio
+async def test_validation_handler_returns_401_for_auth_locations() -> None:
+    from fastapi.exceptions import RequestValidationError
+
+    from app.core.exception_handlers import validation_exception_handler
+
+    exc = RequestValidationError(
+        [
+            {
+                "type": "missing",
+                "loc": ("header", "Authorization"),
+                "msg": "Field required",
+            }
+        ]
+    )
+    response = await validation_exception_handler(None, exc)  # type: ignore[arg-type]
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+    # Cada 401 es una instancia nueva: los middlewares pueden añadir cabeceras
+    other = await validation_exception_handler(None, exc)  # type: ignore[arg-type]
+    assert other is not response
+    response.headers["X-Request-ID"] = "abc"
+    assert "x-request-id" not in other.headers
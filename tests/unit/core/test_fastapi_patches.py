@@ -0,0 +1,32 @@
+from fastapi.dependencies import utils as dependency_utils
+
+from app.core.fastapi_patches import _memoize_check, apply_fastapi_patches
+
+
+def test_memoize_check_caches_per_callable():
+    calls = []
+
+    def check(call):
+        calls.append(call)
+        return True
+
+    async def dependency():
+        return None
+
+    cached = _memoize_check(check)
+    assert cached(dependency) is True
+    assert cached(dependency) is True
+    assert calls == [dependency]
+
+
+def test_memoize_check_falls_back_for_unhashable_callables():
+    cached = _memoize_check(lambda call: False)
+    assert cached([]) is False
+
+
+def test_apply_fastapi_patches_is_idempotent():
+    apply_fastapi_patches()
+    patched = dependency_utils.is_coroutine_callable
+    apply_fastapi_patches()
+    assert dependency_utils.is_coroutine_callable is patched
+    assert hasattr(patched, "__wrapped__")
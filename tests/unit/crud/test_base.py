@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import BaseRepository
+from app.database.models import User
+
+
+def test_base_repository_uses_slots():
+    repo = BaseRepository(User, MagicMock(spec=AsyncSession))
+    assert not hasattr(repo, "__dict__")
+    assert "email" in repo._columns
+
+
+def test_filtered_stmt_rejects_unknown_columns():
+    repo = BaseRepository(User, MagicMock(spec=AsyncSession))
+    with pytest.raises(ValueError, match="no existe en el modelo User"):
+        repo._filtered_stmt(0, 10, {"not_a_column": "x"})
+    # Los filtros a ``None`` se ignoran, incluso si el campo no existe
+    repo._filtered_stmt(0, 10, {"not_a_column": None})
+
+
+def test_keyset_page_orders_by_id_and_caps_limit():
+    import uuid
+
+    from sqlalchemy import select
+
+    from app.crud.base import MAX_PAGE_SIZE, keyset_page
+
+    stmt = keyset_page(select(User), User.id, 10_000, uuid.uuid4())
+    sql = str(stmt)
+    assert "ORDER BY users.id" in sql
+    assert "users.id >" in sql
+    assert stmt._limit == MAX_PAGE_SIZE
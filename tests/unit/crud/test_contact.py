@@ -0,0 +1,30 @@
+import pytest
+
+from app.crud.contact import _filter_key, _filter_params, _filter_stmt
+
+
+def test_filter_stmt_is_reused_for_the_same_fields():
+    first = _filter_stmt("select", _filter_key({"email": "a@b.com", "is_read": False}))
+    second = _filter_stmt("select", _filter_key({"is_read": True, "email": "c@d.com"}))
+    assert first is second
+
+
+def test_filter_none_values_use_is_null():
+    key = _filter_key({"email": None})
+    assert key == (("email", True),)
+    assert _filter_params({"email": None}) == {}
+    assert "IS NULL" in str(_filter_stmt("count", key))
+
+
+def test_filter_stmt_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="para contar"):
+        _filter_stmt("count", _filter_key({"nope": 1}))
+
+
+def test_by_email_statement_matches_read_columns():
+    from app.crud.contact import _READ_COLS, _STMT_BY_EMAIL
+    from app.database.models import Contact
+
+    assert Contact.__tablename__ in str(_STMT_BY_EMAIL)
+    selected = [c.key for c in _STMT_BY_EMAIL.selected_columns]
+    assert selected == [c.key for c in _READ_COLS]
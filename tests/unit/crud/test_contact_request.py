@@ -0,0 +1,42 @@
+import pytest
+
+from app.crud.contact_request import InMemoryContactRequestRepository
+from app.domain.models.contact_request import ContactRequest
+
+
+def _request(email: str) -> ContactRequest:
+    return ContactRequest(
+        full_name="Ana Pérez", email=email, message="Hola, quisiera información"
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_memory_repository_indexes_by_email():
+    repo = InMemoryContactRequestRepository()
+    first = await repo.create(_request("ana@example.com"))
+    await repo.bulk_create([_request("luis@example.com"), _request("ana@example.com")])
+
+    by_email = await repo.get_by_email("ana@example.com")
+    assert len(by_email) == 2
+    assert by_email[0] is first
+    assert await repo.get_by_email("nadie@example.com") == ()
+    assert len(await repo.list()) == 3
+
+
+def test_from_persisted_skips_validation():
+    original = _request("ana@example.com")
+    restored = ContactRequest.from_persisted(
+        original.id,
+        original.full_name,
+        original.email,
+        None,
+        original.message,
+        original.created_at,
+        None,
+    )
+    assert restored == original
+    assert restored.updated_at == original.created_at
+    # Datos de confianza: no se vuelve a ejecutar validate()
+    assert ContactRequest.from_persisted(
+        original.id, "", "sin-arroba", None, "", original.created_at, None
+    )
@@ -0,0 +1,97 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.user import UserRepository
+from app.domain.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_requires_one_hash_per_user():
+    db = AsyncMock(spec=AsyncSession)
+    repo = UserRepository(db)
+    users = [User(email="ana@example.com", full_name="Ana")]
+
+    with pytest.raises(ValueError):
+        await repo.bulk_create(users, [])
+    assert await repo.bulk_create([], []) == []
+    db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_falls_back_to_insert_below_threshold():
+    db = AsyncMock(spec=AsyncSession)
+    db.connection.return_value.dialect.driver = "asyncpg"
+    repo = UserRepository(db)
+    users = [User(email="ana@example.com", full_name="Ana")]
+    repo.bulk_create = AsyncMock(return_value=users)  # type: ignore[method-assign]
+
+    assert await repo.bulk_copy(users, ["hash"]) == users
+
+    repo.bulk_create.assert_awaited_once_with(users, ["hash"])
+    db.connection.return_value.get_raw_connection.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_opens_session_transaction_before_copy(monkeypatch):
+    monkeypatch.setattr("app.crud.user.COPY_THRESHOLD", 1)
+    driver_conn = MagicMock()
+    driver_conn.is_in_transaction.return_value = False
+    driver_conn.copy_records_to_table = AsyncMock()
+    conn = MagicMock()
+    conn.dialect.driver = "asyncpg"
+    conn.execute = AsyncMock()
+    conn.get_raw_connection = AsyncMock(
+        return_value=MagicMock(driver_connection=driver_conn)
+    )
+    db = AsyncMock(spec=AsyncSession)
+    db.connection.return_value = conn
+    users = [User(email="ana@example.com", full_name="Ana")]
+
+    created = await UserRepository(db).bulk_copy(users, ["hash"])
+
+    assert created == users
+    conn.execute.assert_awaited_once()
+    driver_conn.copy_records_to_table.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_by_email_is_cached_per_repository():
+    user_id = uuid4()
+    db = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.first.return_value = (user_id, "ana@example.com", "Ana", True, False)
+    db.execute.return_value = result
+    repo = UserRepository(db)
+
+    first = await repo.get_by_email("ana@example.com")
+    assert first.id == user_id
+    assert await repo.get_by_email("ana@example.com") is first
+    assert await repo.get(user_id) is first
+    db.execute.assert_awaited_once()
+    db.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_uses_single_insert_returning():
+    user_id = uuid4()
+    db = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    created_at = datetime(2024, 1, 1, tzinfo=UTC)
+    result.one.return_value = (
+        user_id, "ana@example.com", "Ana", True, False, created_at, created_at
+    )
+    db.execute.return_value = result
+    repo = UserRepository(db)
+
+    created = await repo.create(User(email="ana@example.com", full_name="Ana"), "h")
+
+    assert created.id == user_id
+    assert created.created_at == created_at
+    assert created.updated_at == created_at
+    db.execute.assert_awaited_once()
+    db.add.assert_not_called()
+    db.flush.assert_not_called()
@@ -256,3 +256,25 @@ def test_timestamps_default_and_update(
     contact.update_message("New message for timestamp test")
     time.sleep(0.001) # Allow time for timestamp to change
     assert contact.updated_at > initial_updated_at
+
+
+def test_contact_from_persisted_matches_constructor(
+    sample_contact_data: dict[str, any]
+) -> None:
+    """from_persisted reconstruye el mismo contacto sin pasar por __init__."""
+    contact = Contact(**sample_contact_data)
+    restored = Contact.from_persisted(
+        contact.id,
+        contact.full_name,
+        contact.email,
+        contact.message,
+        contact.is_read,
+        contact.created_at,
+        None,
+    )
+    assert restored == contact
+    assert restored.full_name == contact.full_name
+    assert restored.email == contact.email
+    assert restored.message == contact.message
+    assert restored.is_read is contact.is_read
+    assert restored.updated_at == contact.created_at
@@ -180,3 +180,16 @@ def test_update_full_name_invalid(invalid_name: str) -> None:
         user.update_full_name(invalid_name)
     assert "full_name" in excinfo.value.errors
     assert excinfo.value.errors["full_name"] == "No puede estar vacío"
+
+
+def test_user_from_persisted_matches_constructor() -> None:
+    """from_persisted reconstruye el mismo usuario sin pasar por __init__."""
+    user = User(email=VALID_EMAIL, full_name="Test User", is_superuser=True)
+    restored = User.from_persisted(
+        user.id, user.email, user.full_name, user.is_active, user.is_superuser
+    )
+    assert restored == user
+    assert restored.email == user.email
+    assert restored.is_superuser is True
+    assert restored.role_ids == set()
+    assert restored.hashed_password is None
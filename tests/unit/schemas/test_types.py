@@ -0,0 +1,24 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.types import normalize_email
+from app.schemas.user import UserCreate
+
+
+def test_user_create_normalizes_email_domain():
+    user = UserCreate(email="test@EXAMPLE.com", password="secret", full_name="Test")
+    assert user.email == "test@example.com"
+
+def test_user_create_rejects_invalid_email():
+    with pytest.raises(ValidationError):
+        UserCreate(email="invalid-email", password="secret", full_name="Test")
+
+def test_normalize_email_is_cached():
+    normalize_email.cache_clear()
+    normalize_email("cached@example.com")
+    normalize_email("cached@example.com")
+    assert normalize_email.cache_info().hits == 1
+
+def test_email_address_keeps_email_format_in_json_schema():
+    schema = UserCreate.model_json_schema()
+    assert schema["properties"]["email"] == {"type": "string", "format": "email"}
@@ -2,7 +2,6 @@ import pytest
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
-from app.core.security.hashing import verify_password
 from app.core.security.jwt import create_access_token
 from app.domain.exceptions.base import ValidationError
 from app.domain.models.user import User
@@ -18,7 +17,7 @@ def auth_service(mock_user_repository: AsyncMock) -> AuthService:
     return AuthService(user_repository=mock_user_repository)
 
 @pytest.mark.asyncio
-@patch('app.services.auth_service.verify_password')
+@patch('app.services.auth_service.averify_password')
 async def test_authenticate_user_success(mock_verify_password: AsyncMock, auth_service: AuthService, mock_user_repository: AsyncMock):
     email = "test@example.com"
     password = "test_password"
@@ -37,7 +36,7 @@ async def test_authenticate_user_success(mock_verify_password: AsyncMock, auth_s
     mock_verify_password.assert_called_once_with(password, mock_hashed_password)
 
 @pytest.mark.asyncio
-@patch('app.services.auth_service.verify_password')
+@patch('app.services.auth_service.averify_password')
 async def test_authenticate_user_not_found(mock_verify_password: AsyncMock, auth_service: AuthService, mock_user_repository: AsyncMock):
     email = "nonexistent@example.com"
     password = "any_password"
@@ -51,7 +50,7 @@ async def test_authenticate_user_not_found(mock_verify_password: AsyncMock, auth
     mock_verify_password.assert_not_called()
 
 @pytest.mark.asyncio
-@patch('app.services.auth_service.verify_password')
+@patch('app.services.auth_service.averify_password')
 async def test_authenticate_user_incorrect_password(mock_verify_password: AsyncMock, auth_service: AuthService, mock_user_repository: AsyncMock):
     email = "test@example.com"
     password = "wrong_password"
@@ -70,7 +69,7 @@ async def test_authenticate_user_incorrect_password(mock_verify_password: AsyncM
     mock_verify_password.assert_called_once_with(password, mock_hashed_password)
 
 @pytest.mark.asyncio
-@patch('app.services.auth_service.verify_password')
+@patch('app.services.auth_service.averify_password')
 async def test_authenticate_user_no_hashed_password(mock_verify_password: AsyncMock, auth_service: AuthService, mock_user_repository: AsyncMock):
     email = "test@example.com"
     password = "test_password"
@@ -88,6 +87,35 @@ async def test_authenticate_user_no_hashed_password(mock_verify_password: AsyncM
     # verify_password no debería llamarse si no hay contraseña hasheada
     mock_verify_password.assert_not_called()
 
+@pytest.mark.asyncio
+@patch('app.services.auth_service.aget_password_hash')
+@patch('app.services.auth_service.password_needs_rehash')
+@patch('app.services.auth_service.averify_password')
+async def test_authenticate_user_rehashes_legacy_hash(
+    mock_verify_password: AsyncMock,
+    mock_needs_rehash: AsyncMock,
+    mock_get_password_hash: AsyncMock,
+    auth_service: AuthService,
+    mock_user_repository: AsyncMock,
+):
+    email = "test@example.com"
+    password = "test_password"
+    mock_user = User(id=uuid4(), email=email, full_name="Test User")
+
+    mock_user_repository.get_by_email.return_value = mock_user
+    mock_user_repository.get_hashed_password_by_email.return_value = "legacy_hash"
+    mock_verify_password.return_value = True
+    mock_needs_rehash.return_value = True
+    mock_get_password_hash.return_value = "new_hash"
+
+    user = await auth_service.authenticate_user(email, password)
+    assert user == mock_user
+    mock_needs_rehash.assert_called_once_with("legacy_hash")
+    mock_get_password_hash.assert_called_once_with(password)
+    mock_user_repository.update_hashed_password.assert_called_once_with(
+        mock_user.id, "new_hash"
+    )
+
 @patch('app.services.auth_service.create_access_token')
 def test_generate_token(mock_create_access_token: AsyncMock, auth_service: AuthService):
     user_id = uuid4()
@@ -96,4 +124,17 @@ def test_generate_token(mock_create_access_token: AsyncMock, auth_service: AuthS
 
     token_data = auth_service.generate_token(mock_user)
     assert token_data == {"access_token": "mock_access_token", "token_type": "bearer"}
-    mock_create_access_token.assert_called_once_with({"sub": str(user_id)})
+    mock_create_access_token.assert_called_once_with(sub=str(user_id))
+
+@patch('app.services.auth_service.create_access_token')
+def test_generate_token_signs_every_login(
+    mock_create_access_token: AsyncMock, auth_service: AuthService
+):
+    mock_user = User(id=uuid4(), email="test@example.com", full_name="Test User")
+    mock_create_access_token.side_effect = ["first_token", "second_token"]
+
+    first = auth_service.generate_token(mock_user)
+    second = auth_service.generate_token(mock_user)
+    assert first["access_token"] == "first_token"
+    assert second["access_token"] == "second_token"
+    assert mock_create_access_token.call_count == 2
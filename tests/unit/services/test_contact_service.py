@@ -183,3 +183,27 @@ async def test_update_contact_message_not_found(contact_service: ContactService,
         await contact_service.update_contact_message(contact_id, "New Message")
     mock_contact_repository.get.assert_called_once_with(contact_id)
     mock_contact_repository.update.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_iter_contacts_streams_from_repository(
+    contact_service: ContactService, mock_contact_repository: AsyncMock
+):
+    contacts = [
+        Contact(
+            id=uuid4(), full_name="John Doe", email="john@example.com", message="Hello"
+        ),
+        Contact(
+            id=uuid4(), full_name="Jane Doe", email="jane@example.com", message="Hi"
+        ),
+    ]
+
+    async def _iter():
+        for c in contacts:
+            yield c
+
+    mock_contact_repository.iter_all.return_value = _iter()
+
+    result = [c async for c in contact_service.iter_contacts()]
+
+    assert result == contacts
+    mock_contact_repository.iter_all.assert_called_once_with()
@@ -74,12 +74,17 @@ async def test_list_roles_with_name_filter(role_service: RoleService, mock_role_
         Role(id=uuid4(), name="role1", description="Desc1"),
         Role(id=uuid4(), name="filtered_role", description="Filtered Desc"),
     ]
-    mock_role_repository.list.return_value = mock_roles
+    mock_role_repository.filter_by.return_value = [
+        r for r in mock_roles if r.name == "filtered_role"
+    ]
 
     results = await role_service.list_roles(name="filtered_role")
     assert len(results) == 1
     assert results[0].name == "filtered_role"
-    mock_role_repository.list.assert_called_once()
+    mock_role_repository.filter_by.assert_called_once_with(
+        limit=100, after_id=None, name="filtered_role"
+    )
+    mock_role_repository.list.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_create_role_success(role_service: RoleService, mock_role_repository: AsyncMock):
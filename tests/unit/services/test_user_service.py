@@ -184,7 +184,7 @@ async def test_get_users(
     
     # Assert
     assert result == users
-    mock_user_repo.list.assert_called_once()
+    mock_user_repo.list.assert_called_once_with(limit=100, after_id=None)
 
 
 @pytest.mark.asyncio
@@ -203,7 +203,9 @@ async def test_get_users_with_email_filter(
             is_active=True
         )
     ]
-    mock_user_repo.list.return_value = users
+    mock_user_repo.filter_by.return_value = [
+        u for u in users if u.email == "test@example.com"
+    ]
     
     # Act
     result = await user_service.get_users(email="test@example.com")
@@ -211,7 +213,10 @@ async def test_get_users_with_email_filter(
     # Assert
     assert len(result) == 1
     assert result[0].email == "test@example.com"
-    mock_user_repo.list.assert_called_once()
+    mock_user_repo.filter_by.assert_called_once_with(
+        limit=100, after_id=None, email="test@example.com"
+    )
+    mock_user_repo.list.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -233,7 +238,7 @@ async def test_get_users_with_active_filter(
             is_active=False
         )
     ]
-    mock_user_repo.list.return_value = users
+    mock_user_repo.filter_by.return_value = [u for u in users if u.is_active]
     
     # Act
     result = await user_service.get_users(is_active=True)
@@ -242,7 +247,9 @@ async def test_get_users_with_active_filter(
     assert len(result) == 1
     assert result[0].email == "user1@example.com"
     assert result[0].is_active is True
-    mock_user_repo.list.assert_called_once()
+    mock_user_repo.filter_by.assert_called_once_with(
+        limit=100, after_id=None, is_active=True
+    )
 
 
 @pytest.mark.asyncio
@@ -269,7 +276,9 @@ async def test_get_users_with_both_filters(
             is_active=True
         )
     ]
-    mock_user_repo.list.return_value = users
+    mock_user_repo.filter_by.return_value = [
+        u for u in users if u.email == "user1@example.com" and u.is_active
+    ]
     
     # Act
     result = await user_service.get_users(email="user1@example.com", is_active=True)
@@ -279,7 +288,9 @@ async def test_get_users_with_both_filters(
     assert result[0].email == "user1@example.com"
     assert result[0].is_active is True
     assert result[0].full_name == "User One"
-    mock_user_repo.list.assert_called_once()
+    mock_user_repo.filter_by.assert_called_once_with(
+        limit=100, after_id=None, email="user1@example.com", is_active=True
+    )
 
 
 @pytest.mark.asyncio